@@ -9,7 +9,7 @@ if ((BASH_VERSINFO[0] < 4)); then
   echo "Error: This script requires Bash 4.0 or later."
   echo "Current version: ${BASH_VERSION}"
   echo ""
-  if [[ "$(uname -s)" == "Darwin" ]]; then
+  if [[ "$OSTYPE" == "darwin"* ]]; then
     echo "On macOS, install a newer bash with Homebrew:"
     echo "  brew install bash"
     echo ""
@@ -33,6 +33,84 @@ declare -A TOOL_SELECTED
 declare -A TOOL_VERSION_CONFIGURABLE
 declare -A TOOL_VERSION_VALUE
 
+# devcontainer.json sections keyed by marker name, loaded once by load_devcontainer_sections
+declare -A DEVCONTAINER_SECTIONS
+# The same sections with their Begin/End marker comments already stripped
+declare -A DEVCONTAINER_SECTION_BODIES
+# Everything before the "extensions" array, and the file the cache was loaded from
+DEVCONTAINER_HEADER=""
+DEVCONTAINER_LOADED_FILE=""
+
+# Tools the user selected, collected once after tool selection
+SELECTED_TOOLS=()
+# psi-header languages for the selected tools, in selection order without duplicates
+SELECTED_PSI_HEADER_LANGUAGES=()
+
+# Newline-separated tool names per .mise.toml section, recorded by parse_mise_sections
+declare -A SECTION_TOOLS
+
+# Environment, [alias] and [settings] blocks of .mise.toml, recorded by parse_mise_sections for generate_mise_toml
+MISE_ENVIRONMENT_SECTION=""
+MISE_ALIAS_SECTION=""
+MISE_SETTINGS_SECTION=""
+
+# Newline-separated selected tools per .mise.toml section in file order, recorded by collect_selected_tools
+declare -A SELECTED_SECTION_TOOLS
+
+# Selected tools of one section, filled by collect_section_selected_tools
+SECTION_SELECTED_TOOLS=()
+
+# devcontainer.json extension and settings sections contributed by each tool
+declare -A TOOL_EXTENSION_SECTIONS=(
+  [go]="Go" [goreleaser]="Go"
+  [dotnet]=".NET"
+  [node]="JavaScript/Node.js" [pnpm]="JavaScript/Node.js" [yarn]="JavaScript/Node.js" [deno]="JavaScript/Node.js" [bun]="JavaScript/Node.js"
+  [kubectl]="Kubernetes/Helm" [helm]="Kubernetes/Helm" [k9s]="Kubernetes/Helm" [kubectx]="Kubernetes/Helm"
+  [kubens]="Kubernetes/Helm" [krew]="Kubernetes/Helm" [dive]="Kubernetes/Helm" [kubebench]="Kubernetes/Helm"
+  [popeye]="Kubernetes/Helm" [trivy]="Kubernetes/Helm" [cmctl]="Kubernetes/Helm" [k3d]="Kubernetes/Helm"
+  [opentofu]="Terraform/OpenTofu"
+  [packer]="Packer"
+  [powershell]="PowerShell"
+  [python]="Python"
+)
+declare -A TOOL_SETTINGS_SECTIONS=(
+  [go]="Go" [goreleaser]="Go"
+  [dotnet]=".NET"
+  [node]="JavaScript/Node.js" [pnpm]="JavaScript/Node.js" [yarn]="JavaScript/Node.js" [deno]="JavaScript/Node.js" [bun]="JavaScript/Node.js"
+  [kubectl]="Kubernetes/Helm" [helm]="Kubernetes/Helm" [k9s]="Kubernetes/Helm" [kubectx]="Kubernetes/Helm"
+  [kubens]="Kubernetes/Helm" [krew]="Kubernetes/Helm" [dive]="Kubernetes/Helm" [kubebench]="Kubernetes/Helm"
+  [popeye]="Kubernetes/Helm" [trivy]="Kubernetes/Helm" [cmctl]="Kubernetes/Helm" [k3d]="Kubernetes/Helm"
+  [powershell]="PowerShell"
+)
+
+# psi-header languages configured for each tool, and comment syntax per language as "begin|end|prefix"
+declare -A TOOL_PSI_HEADER_LANGUAGES=(
+  [go]="go" [golang]="go"
+  [dotnet]="csharp"
+  [node]="javascript typescript" [pnpm]="javascript typescript" [yarn]="javascript typescript"
+  [deno]="javascript typescript" [bun]="javascript typescript"
+  [python]="python"
+  [powershell]="powershell"
+  [opentofu]="terraform"
+)
+declare -A PSI_HEADER_LANG_SYNTAX=(
+  [python]="||# "
+  [powershell]="<#|#>|"
+  [terraform]="||# "
+  [dockerfile]="||# "
+  [shellscript]="||# "
+  [markdown]="||> "
+  [yaml]="||# "
+  [env]="||# "
+)
+
+# Tool and optional extension sections to write, collected once per generation by collect_active_sections
+ACTIVE_EXTENSION_SECTIONS=()
+ACTIVE_SETTINGS_SECTIONS=()
+
+# Extension sections already written to the generated devcontainer.json, reset per generation
+declare -A INCLUDED_EXTENSION_SECTIONS
+
 # Extension flags
 INCLUDE_PYTHON_EXTENSIONS=${INCLUDE_PYTHON_EXTENSIONS:-false}
 INCLUDE_MARKDOWN_EXTENSIONS=${INCLUDE_MARKDOWN_EXTENSIONS:-false}
@@ -59,12 +137,14 @@ PYTHON_GITHUB_USERNAME=""
 PYTHON_GITHUB_PROJECT=""
 PYTHON_LICENSE=""
 PYTHON_KEYWORDS=""
+# Package name derived from a project name by python_package_name, and the name it was derived from
+PYTHON_PACKAGE_NAME=""
+PYTHON_PACKAGE_NAME_SOURCE=""
 
 # PSI Header configuration
 INSTALL_PSI_HEADER=false
 PSI_HEADER_COMPANY=""
 PSI_HEADER_TEMPLATES=()
-declare -A PSI_HEADER_LANG_CONFIG
 
 # Files and directories to copy to new projects
 FILES_TO_COPY=(
@@ -94,9 +174,11 @@ DIALOG_HEIGHT=25
 DIALOG_WIDTH=85
 DIALOG_CHECKLIST_HEIGHT=20
 
-# Colors for dialog
+# Colors for dialog, written by write_dialog_config once the TUI is about to start
 export DIALOGRC=/tmp/dialogrc
-cat > "$DIALOGRC" << 'EOF'
+
+write_dialog_config() {
+  cat > "$DIALOGRC" << 'EOF'
 # Dialog color configuration
 screen_color = (CYAN,BLUE,ON)
 shadow_color = (BLACK,BLACK,ON)
@@ -137,11 +219,12 @@ inputbox_border2_color = (WHITE,BLUE,ON)
 searchbox_border2_color = (WHITE,BLUE,ON)
 menubox_border2_color = (WHITE,BLUE,ON)
 EOF
+}
 
 # Detect OS and package manager
 detect_os_and_package_manager() {
   # Check for macOS first
-  if [[ "$(uname -s)" == "Darwin" ]]; then
+  if [[ "$OSTYPE" == "darwin"* ]]; then
     if command -v brew >/dev/null 2>&1; then
       echo "brew"
     else
@@ -210,15 +293,37 @@ detect_os_and_package_manager() {
 
 # Portable sed -i function that works on both macOS and Linux
 sed_inplace() {
-  if [[ "$(uname -s)" == "Darwin" ]]; then
+  if [[ "$OSTYPE" == "darwin"* ]]; then
     # macOS requires a backup extension (use empty string with -i '')
     sed -i '' "$@"
   else
     # Linux sed doesn't need the extension argument
-    sed_inplace "$@"
+    sed -i "$@"
+  fi
+}
+
+# Move a generated file over its destination only when the content differs, so re-running the installer
+# on an existing project leaves unchanged files (and their timestamps) alone
+move_if_changed() {
+  local source_file="$1"
+  local destination_file="$2"
+  
+  if [[ -f "$destination_file" ]] && cmp -s "$source_file" "$destination_file"; then
+    rm -f "$source_file"
+  else
+    mv "$source_file" "$destination_file"
   fi
 }
 
+# Escape a value for use in the replacement part of a sed "s|...|...|" expression
+escape_sed_replacement() {
+  local value="$1"
+  value="${value//\\/\\\\}"
+  value="${value//|/\\|}"
+  value="${value//&/\\&}"
+  printf '%s' "$value"
+}
+
 # Install dialog using detected package manager
 install_dialog() {
   local package_manager="$1"
@@ -280,13 +385,14 @@ check_dependencies() {
     package_manager=$(detect_os_and_package_manager)
     
     if [[ "$package_manager" == "unknown" ]]; then
-      echo "Error: Could not detect your package manager. Please install dialog manually:"
-      echo "  On Rocky Linux/RHEL/CentOS/Fedora: dnf install dialog"
-      echo "  On Ubuntu/Debian: apt-get install dialog"
-      echo "  On Arch/Manjaro: pacman -S dialog"
-      echo "  On openSUSE: zypper install dialog"
-      echo "  On Alpine: apk add dialog"
-      echo "  On macOS: brew install dialog"
+      printf '%s\n' \
+        "Error: Could not detect your package manager. Please install dialog manually:" \
+        "  On Rocky Linux/RHEL/CentOS/Fedora: dnf install dialog" \
+        "  On Ubuntu/Debian: apt-get install dialog" \
+        "  On Arch/Manjaro: pacman -S dialog" \
+        "  On openSUSE: zypper install dialog" \
+        "  On Alpine: apk add dialog" \
+        "  On macOS: brew install dialog"
       exit 1
     fi
     
@@ -381,8 +487,9 @@ run_container_command() {
     return 1
   fi
   
-  container_cmd=$(echo "$container_info" | cut -d':' -f1)
-  runtime_type=$(echo "$container_info" | cut -d':' -f2)
+  # Split "command:type" into the runtime command and its type
+  container_cmd="${container_info%%:*}"
+  runtime_type="${container_info#*:}"
   
   case "$runtime_type" in
     "docker"|"podman"|"nerdctl")
@@ -402,10 +509,11 @@ get_latest_major_versions() {
   # Special handling for Python versions
   if [[ "$tool_name" == "python" ]]; then
     # Fetch remote versions using mise, handle potential errors, and filter for standard CPython versions
+    # (the strict X.Y.Z pattern already rejects rc/alpha/beta releases, so no second filter is needed)
     if command -v mise >/dev/null 2>&1; then
-      versions=$(mise ls-remote "$tool_name" 2>/dev/null | grep -E '^[0-9]+\.[0-9]+\.[0-9]+$' | grep -v -E 'rc|alpha|beta' 2>/dev/null || echo "")
+      versions=$(mise ls-remote "$tool_name" 2>/dev/null | grep -E '^[0-9]+\.[0-9]+\.[0-9]+$' 2>/dev/null || echo "")
     elif detect_container_runtime >/dev/null 2>&1; then
-      versions=$(run_container_command jdxcode/mise mise ls-remote "$tool_name" 2>/dev/null | grep -E '^[0-9]+\.[0-9]+\.[0-9]+$' | grep -v -E 'rc|alpha|beta' 2>/dev/null || echo "")
+      versions=$(run_container_command jdxcode/mise mise ls-remote "$tool_name" 2>/dev/null | grep -E '^[0-9]+\.[0-9]+\.[0-9]+$' 2>/dev/null || echo "")
     else
       echo "ERROR: Neither mise nor any container runtime (docker/podman/nerdctl) is available." >&2
       echo ""
@@ -420,7 +528,7 @@ get_latest_major_versions() {
     
     # For Python, get major.minor versions (e.g., 3.13, 3.12, 3.11)
     local major_versions
-    major_versions=$(echo "$versions" | awk -F. '{print $1"."$2}' | sort -rV | uniq | head -n 5 | tr '\n' ',' | sed 's/,$//')
+    major_versions=$(echo "$versions" | awk -F. '{print $1"."$2}' | sort -rV | awk -v limit=5 '!seen[$0]++ { out = out (n++ ? "," : "") $0; if (n == limit) exit } END { print out }')
     
     if [[ -n "$major_versions" ]]; then
       echo "(e.g., ${major_versions})"
@@ -448,13 +556,16 @@ get_latest_major_versions() {
   
   local major_versions
   # Parse versions to get unique major versions, sorted numerically
-  if [[ "$tool_name" == "kubectl" || "$tool_name" == "go" || "$tool_name" == "golang" || "$tool_name" == "opentofu" || "$tool_name" == "openbao" || "$tool_name" == "packer" ]]; then
-    # For versions like 1.31.2, major is 1.31
-    major_versions=$(echo "$versions" | awk -F. '{print $1"."$2}' | sort -rV | uniq | head -n 5 | tr '\n' ',' | sed 's/,$//')
-  else
-    # For versions like 22.10.0, major is 22
-    major_versions=$(echo "$versions" | awk -F. '{print $1}' | sort -rV | uniq | head -n 5 | tr '\n' ',' | sed 's/,$//')
-  fi
+  case "$tool_name" in
+    kubectl|go|golang|opentofu|openbao|packer)
+      # For versions like 1.31.2, major is 1.31
+      major_versions=$(echo "$versions" | awk -F. '{print $1"."$2}' | sort -rV | awk -v limit=5 '!seen[$0]++ { out = out (n++ ? "," : "") $0; if (n == limit) exit } END { print out }')
+      ;;
+    *)
+      # For versions like 22.10.0, major is 22
+      major_versions=$(echo "$versions" | awk -F. '{print $1}' | sort -rV | awk -v limit=5 '!seen[$0]++ { out = out (n++ ? "," : "") $0; if (n == limit) exit } END { print out }')
+      ;;
+  esac
   
   if [[ -n "$major_versions" ]]; then
     echo "(e.g., ${major_versions})"
@@ -467,15 +578,57 @@ get_latest_major_versions() {
 parse_mise_sections() {
   local file=".mise.toml"
   local in_tools_section=false
+  local tools_done=false
+  local in_environment=false
+  local in_alias=false
+  local in_settings=false
   local current_section=""
-  local current_section_name=""
-  local current_tools=()
   local previous_line=""
+  local table_regex='^\[.*\]'
+  local begin_regex='^#### Begin (.+)$'
+  local end_regex='^#### End (.+)$'
+  local tool_regex='^([a-zA-Z0-9_-]+) *= *'
+  local -a lines
+  local line
   
   # Clear global arrays
   INSTALL_SECTIONS=()
-  
-  while IFS= read -r line || [[ -n "$line" ]]; do
+  SECTION_TOOLS=()
+  MISE_ENVIRONMENT_SECTION=""
+  MISE_ALIAS_SECTION=""
+  MISE_SETTINGS_SECTION=""
+  
+  # Read the whole file into an array, then classify each line
+  mapfile -t lines < "$file"
+  
+  for line in "${lines[@]}"; do
+    # Keep the blocks generate_mise_toml copies verbatim, so the file is only read once per run
+    if [[ "$line" == "#### Begin Environment" ]]; then
+      in_environment=true
+    elif [[ "$line" == "#### End Environment" ]]; then
+      in_environment=false
+    elif [[ "$in_environment" == true ]]; then
+      MISE_ENVIRONMENT_SECTION+="$line"$'\n'
+    fi
+    if [[ "$line" == "[alias]"* ]]; then
+      in_alias=true
+    elif [[ "$in_alias" == true && "$line" == "["* ]]; then
+      in_alias=false
+    fi
+    if [[ "$line" == "[settings]"* ]]; then
+      in_settings=true
+    fi
+    if [[ "$in_alias" == true ]]; then
+      MISE_ALIAS_SECTION+="$line"$'\n'
+    fi
+    if [[ "$in_settings" == true ]]; then
+      MISE_SETTINGS_SECTION+="$line"$'\n'
+    fi
+    
+    if [[ "$tools_done" == true ]]; then
+      continue
+    fi
+    
     # Check if we're entering the [tools] section
     if [[ "$line" == "[tools]" ]]; then
       in_tools_section=true
@@ -483,45 +636,44 @@ parse_mise_sections() {
     fi
     
     # Check if we're leaving the [tools] section
-    if [[ "$in_tools_section" == true && "$line" =~ ^\[.*\] ]]; then
+    if [[ "$in_tools_section" == true && "$line" =~ $table_regex ]]; then
       # Save the last section if it exists
       if [[ -n "$current_section" ]]; then
         INSTALL_SECTIONS+=("$current_section")
       fi
-      break
+      in_tools_section=false
+      tools_done=true
+      continue
     fi
     
     # Only process lines within the [tools] section
     if [[ "$in_tools_section" == true ]]; then
       # Check for section start marker
-      if [[ "$line" =~ ^####\ Begin\ (.+)$ ]]; then
+      if [[ "$line" =~ $begin_regex ]]; then
         # Save previous section if it exists
         if [[ -n "$current_section" ]]; then
           INSTALL_SECTIONS+=("$current_section")
         fi
         
         # Start new section
-        current_section_name="${BASH_REMATCH[1]}"
-        current_section="$current_section_name"
-        current_tools=()
+        current_section="${BASH_REMATCH[1]}"
         continue
       fi
       
       # Check for section end marker
-      if [[ "$line" =~ ^####\ End\ (.+)$ ]]; then
+      if [[ "$line" =~ $end_regex ]]; then
         # Save current section
         if [[ -n "$current_section" ]]; then
           INSTALL_SECTIONS+=("$current_section")
         fi
         current_section=""
-        current_section_name=""
         continue
       fi
       
       # Check for tool definition within a section
-      if [[ -n "$current_section" && "$line" =~ ^([a-zA-Z0-9_-]+)\ *=\ * ]]; then
+      if [[ -n "$current_section" && "$line" =~ $tool_regex ]]; then
         local tool_name="${BASH_REMATCH[1]}"
-        current_tools+=("$tool_name")
+        SECTION_TOOLS["$current_section"]+="$tool_name"$'\n'
         
         # Check if previous line had #version# marker for this specific tool
         if [[ "$previous_line" == "#version#" ]]; then
@@ -537,7 +689,7 @@ parse_mise_sections() {
     fi
     
     previous_line="$line"
-  done < "$file"
+  done
   
   # Save the last section if it exists
   if [[ -n "$current_section" ]]; then
@@ -545,29 +697,53 @@ parse_mise_sections() {
   fi
 }
 
-# Get tools from a specific section
-get_section_tools() {
-  local section_name="$1"
-  local file=".mise.toml"
-  local in_section=false
-  local tools=()
+# Collect the selected tools once so later steps don't re-filter TOOL_SELECTED
+collect_selected_tools() {
+  SELECTED_TOOLS=()
+  SELECTED_PSI_HEADER_LANGUAGES=()
+  local tool language section
+  local tool_languages=()
+  local -A added_languages=()
   
-  while IFS= read -r line || [[ -n "$line" ]]; do
-    if [[ "$line" == "#### Begin $section_name" ]]; then
-      in_section=true
-      continue
-    fi
-    
-    if [[ "$line" == "#### End $section_name" ]]; then
-      break
-    fi
+  # Record each section's selected tools once, for the summary and generate_mise_toml
+  SELECTED_SECTION_TOOLS=()
+  for section in "${INSTALL_SECTIONS[@]}"; do
+    SELECTED_SECTION_TOOLS["$section"]=""
+    # Tool names are restricted to [a-zA-Z0-9_-] by parse_mise_sections, so word splitting on the
+    # script's newline IFS is safe here
+    # shellcheck disable=SC2086
+    for tool in ${SECTION_TOOLS[$section]:-}; do
+      if [[ "${TOOL_SELECTED[$tool]:-false}" == "true" ]]; then
+        SELECTED_SECTION_TOOLS["$section"]+="$tool"$'\n'
+      fi
+    done
+  done
+  
+  for tool in "${!TOOL_SELECTED[@]}"; do
+    [[ "${TOOL_SELECTED[$tool]}" == "true" ]] || continue
+    SELECTED_TOOLS+=("$tool")
     
-    if [[ "$in_section" == true && "$line" =~ ^([a-zA-Z0-9_-]+)\ *=\ * ]]; then
-      tools+=("${BASH_REMATCH[1]}")
-    fi
-  done < "$file"
+    # Most tools map to no psi-header language; skip the here-string split for them
+    [[ -n "${TOOL_PSI_HEADER_LANGUAGES[$tool]:-}" ]] || continue
+    IFS=' ' read -r -a tool_languages <<< "${TOOL_PSI_HEADER_LANGUAGES[$tool]}"
+    for language in "${tool_languages[@]}"; do
+      if [[ -z "${added_languages[$language]:-}" ]]; then
+        added_languages["$language"]=true
+        SELECTED_PSI_HEADER_LANGUAGES+=("$language")
+      fi
+    done
+  done
+  return 0
+}
+
+# Fill SECTION_SELECTED_TOOLS with the selected tools of a section in .mise.toml order, from the
+# per-section lists recorded by collect_selected_tools
+collect_section_selected_tools() {
+  local section_name="$1"
+  local IFS=$'\n'
   
-  printf '%s\n' "${tools[@]}"
+  # shellcheck disable=SC2206
+  SECTION_SELECTED_TOOLS=(${SELECTED_SECTION_TOOLS[$section_name]:-})
 }
 
 #TUI input dialog with default value
@@ -638,29 +814,47 @@ show_welcome() {
 collect_project_info() {
   local project_path="$1"
   
-  # Extract default project name from path
-  local default_project_name
-  default_project_name=$(basename "$project_path")
+  # Extract default project name from path (main already stripped any trailing slash)
+  local default_project_name="${project_path##*/}"
   
-  # Generate default display name
-  local default_display_name
-  default_display_name=$(echo "$default_project_name" | sed 's/[-_]/ /g' | sed 's/\b\w/\U&/g')
+  # Turn separators into spaces once; the display name and exec command are both derived from the words
+  local spaced_project_name="${default_project_name//[-_]/ }"
+  
+  # Generate default display name (capitalize the first character of every word)
+  local default_display_name=""
+  local i char previous_is_word=false
+  for ((i = 0; i < ${#spaced_project_name}; i++)); do
+    char="${spaced_project_name:i:1}"
+    if [[ "$char" == [[:alnum:]] ]]; then
+      [[ "$previous_is_word" == false ]] && char="${char^}"
+      previous_is_word=true
+    else
+      previous_is_word=false
+    fi
+    default_display_name+="$char"
+  done
   
   # Generate default container name
   local default_container_name="${default_project_name}-container"
   
-  # Generate default docker exec command
-  local default_docker_exec_command
-  default_docker_exec_command=$(echo "$default_project_name" | sed 's/[-_]/ /g' | awk '{for(i=1;i<=NF;i++) printf("%s", substr($i,1,1))}')
+  # Generate default docker exec command (first character of every word)
+  local default_docker_exec_command=""
+  local word
+  local words=()
+  IFS=' ' read -r -a words <<< "$spaced_project_name"
+  for word in "${words[@]}"; do
+    default_docker_exec_command+="${word:0:1}"
+  done
   
-  # Collect all project information in one form
+  # Collect all project information in one form; the fields are built once and reused if the form is shown again
+  local form_spec=("Project Name:" 1 1 "$default_project_name" 1 20 40 0
+                   "Display Name:" 2 1 "$default_display_name" 2 20 40 0
+                   "Container Name:" 3 1 "$default_container_name" 3 20 40 0
+                   "Docker Command:" 4 1 "$default_docker_exec_command" 4 20 40 0)
   local form_result
   form_result=$(tui_form "Project Configuration" \
                         "Enter your project configuration details:" \
-                        "Project Name:" 1 1 "$default_project_name" 1 20 40 0 \
-                        "Display Name:" 2 1 "$default_display_name" 2 20 40 0 \
-                        "Container Name:" 3 1 "$default_container_name" 3 20 40 0 \
-                        "Docker Command:" 4 1 "$default_docker_exec_command" 4 20 40 0)
+                        "${form_spec[@]}")
   
   if [[ -z "$form_result" ]]; then
     # User cancelled project configuration - ask for confirmation
@@ -671,10 +865,7 @@ collect_project_info() {
       # User wants to continue, ask for project configuration again
       form_result=$(tui_form "Project Configuration" \
                             "Enter your project configuration details:" \
-                            "Project Name:" 1 1 "$default_project_name" 1 20 40 0 \
-                            "Display Name:" 2 1 "$default_display_name" 2 20 40 0 \
-                            "Container Name:" 3 1 "$default_container_name" 3 20 40 0 \
-                            "Docker Command:" 4 1 "$default_docker_exec_command" 4 20 40 0)
+                            "${form_spec[@]}")
       
       # If they cancel again, exit gracefully
       if [[ -z "$form_result" ]]; then
@@ -684,11 +875,13 @@ collect_project_info() {
     fi
   fi
   
-  # Parse form result (each field on a separate line)
-  PROJECT_NAME=$(echo "$form_result" | sed -n '1p')
-  DISPLAY_NAME=$(echo "$form_result" | sed -n '2p')
-  CONTAINER_NAME=$(echo "$form_result" | sed -n '3p')
-  DOCKER_EXEC_COMMAND=$(echo "$form_result" | sed -n '4p')
+  # Split the form result into fields, one per line
+  local -a form_fields
+  mapfile -t form_fields <<< "$form_result"
+  PROJECT_NAME="${form_fields[0]:-}"
+  DISPLAY_NAME="${form_fields[1]:-}"
+  CONTAINER_NAME="${form_fields[2]:-}"
+  DOCKER_EXEC_COMMAND="${form_fields[3]:-}"
   
   # Validate required fields
   if [[ -z "$PROJECT_NAME" ]]; then
@@ -720,14 +913,6 @@ configure_python_repositories() {
                     3>&1 1>&2 2>&3 3>&-)
   
   case "$repo_type" in
-    "pypi")
-      PYTHON_REPOSITORY_TYPE="pypi"
-      PYTHON_PUBLISH_URL="https://upload.pypi.org/legacy/"
-      PYTHON_INDEX_URL="https://pypi.org/simple/"
-      PYTHON_EXTRA_INDEX_URL=""
-      PYTHON_DEV_SUFFIX=""
-      PYTHON_PROD_SUFFIX=""
-      ;;
     "artifactory")
       PYTHON_REPOSITORY_TYPE="artifactory"
       configure_artifactory_urls
@@ -741,7 +926,7 @@ configure_python_repositories() {
       configure_custom_urls
       ;;
     *)
-      # Default to PyPI if cancelled
+      # PyPI, which is also the default if cancelled
       PYTHON_REPOSITORY_TYPE="pypi"
       PYTHON_PUBLISH_URL="https://upload.pypi.org/legacy/"
       PYTHON_INDEX_URL="https://pypi.org/simple/"
@@ -752,54 +937,46 @@ configure_python_repositories() {
   esac
 }
 
-# Configure Artifactory URLs
-configure_artifactory_urls() {
+# Configure server-based repository URLs (Artifactory and Nexus share the same form and URL layout)
+configure_server_repository_urls() {
+  local product="$1"
+  local default_server_url="$2"
+  local default_repository_name="$3"
+  local repository_path="$4"
+  local publish_url_suffix="$5"
   local form_result
-  form_result=$(tui_form "Artifactory Configuration" \
-                        "Enter your Artifactory repository configuration:" \
-                        "Server URL:" 1 1 "https://your-artifactory.com" 1 15 50 0 \
-                        "Repository Name:" 2 1 "your-pypi-repo" 2 20 30 0 \
+  form_result=$(tui_form "$product Configuration" \
+                        "Enter your $product repository configuration:" \
+                        "Server URL:" 1 1 "$default_server_url" 1 15 50 0 \
+                        "Repository Name:" 2 1 "$default_repository_name" 2 20 30 0 \
                         "Dev Suffix:" 3 1 "-dev" 3 15 20 0 \
                         "Prod Suffix:" 4 1 "" 4 16 20 0)
   
   if [[ -n "$form_result" ]]; then
-    local server_url repository_name dev_suffix prod_suffix
-    server_url=$(echo "$form_result" | sed -n '1p')
-    repository_name=$(echo "$form_result" | sed -n '2p')
-    dev_suffix=$(echo "$form_result" | sed -n '3p')
-    prod_suffix=$(echo "$form_result" | sed -n '4p')
+    local -a form_fields
+    mapfile -t form_fields <<< "$form_result"
+    local server_url="${form_fields[0]:-}"
+    local repository_name="${form_fields[1]:-}"
+    local dev_suffix="${form_fields[2]:-}"
+    local prod_suffix="${form_fields[3]:-}"
     
-    PYTHON_PUBLISH_URL="${server_url}/artifactory/api/pypi/${repository_name}"
-    PYTHON_INDEX_URL="${server_url}/artifactory/api/pypi/${repository_name}/simple"
+    local repository_url="${server_url}${repository_path}${repository_name}"
+    PYTHON_PUBLISH_URL="${repository_url}${publish_url_suffix}"
+    PYTHON_INDEX_URL="${repository_url}/simple"
     PYTHON_EXTRA_INDEX_URL=""
     PYTHON_DEV_SUFFIX="$dev_suffix"
     PYTHON_PROD_SUFFIX="$prod_suffix"
   fi
 }
 
+# Configure Artifactory URLs
+configure_artifactory_urls() {
+  configure_server_repository_urls "Artifactory" "https://your-artifactory.com" "your-pypi-repo" "/artifactory/api/pypi/" ""
+}
+
 # Configure Nexus URLs
 configure_nexus_urls() {
-  local form_result
-  form_result=$(tui_form "Nexus Configuration" \
-                        "Enter your Nexus repository configuration:" \
-                        "Server URL:" 1 1 "https://your-nexus.com" 1 15 50 0 \
-                        "Repository Name:" 2 1 "pypi-internal" 2 20 30 0 \
-                        "Dev Suffix:" 3 1 "-dev" 3 15 20 0 \
-                        "Prod Suffix:" 4 1 "" 4 16 20 0)
-  
-  if [[ -n "$form_result" ]]; then
-    local server_url repository_name dev_suffix prod_suffix
-    server_url=$(echo "$form_result" | sed -n '1p')
-    repository_name=$(echo "$form_result" | sed -n '2p')
-    dev_suffix=$(echo "$form_result" | sed -n '3p')
-    prod_suffix=$(echo "$form_result" | sed -n '4p')
-    
-    PYTHON_PUBLISH_URL="${server_url}/repository/${repository_name}/"
-    PYTHON_INDEX_URL="${server_url}/repository/${repository_name}/simple"
-    PYTHON_EXTRA_INDEX_URL=""
-    PYTHON_DEV_SUFFIX="$dev_suffix"
-    PYTHON_PROD_SUFFIX="$prod_suffix"
-  fi
+  configure_server_repository_urls "Nexus" "https://your-nexus.com" "pypi-internal" "/repository/" "/"
 }
 
 # Configure custom URLs
@@ -814,11 +991,13 @@ configure_custom_urls() {
                         "Prod Suffix:" 5 1 "" 5 16 20 0)
   
   if [[ -n "$form_result" ]]; then
-    PYTHON_PUBLISH_URL=$(echo "$form_result" | sed -n '1p')
-    PYTHON_INDEX_URL=$(echo "$form_result" | sed -n '2p')
-    PYTHON_EXTRA_INDEX_URL=$(echo "$form_result" | sed -n '3p')
-    PYTHON_DEV_SUFFIX=$(echo "$form_result" | sed -n '4p')
-    PYTHON_PROD_SUFFIX=$(echo "$form_result" | sed -n '5p')
+    local -a form_fields
+    mapfile -t form_fields <<< "$form_result"
+    PYTHON_PUBLISH_URL="${form_fields[0]:-}"
+    PYTHON_INDEX_URL="${form_fields[1]:-}"
+    PYTHON_EXTRA_INDEX_URL="${form_fields[2]:-}"
+    PYTHON_DEV_SUFFIX="${form_fields[3]:-}"
+    PYTHON_PROD_SUFFIX="${form_fields[4]:-}"
   fi
 }
 
@@ -830,6 +1009,7 @@ configure_python_project() {
 
   # Project basic information
   local form_result
+  local -a form_fields
   form_result=$(tui_form "Python Project Information" \
                         "Enter your Python project details:" \
                         "Project Name:" 1 1 "$PROJECT_NAME" 1 15 40 0 \
@@ -838,10 +1018,11 @@ configure_python_project() {
                         "Keywords:" 4 1 "python,cli,automation" 4 12 50 0)
   
   if [[ -n "$form_result" ]]; then
-    PYTHON_PROJECT_NAME=$(echo "$form_result" | sed -n '1p')
-    PYTHON_PROJECT_DESCRIPTION=$(echo "$form_result" | sed -n '2p')
-    PYTHON_LICENSE=$(echo "$form_result" | sed -n '3p')
-    PYTHON_KEYWORDS=$(echo "$form_result" | sed -n '4p')
+    mapfile -t form_fields <<< "$form_result"
+    PYTHON_PROJECT_NAME="${form_fields[0]:-}"
+    PYTHON_PROJECT_DESCRIPTION="${form_fields[1]:-}"
+    PYTHON_LICENSE="${form_fields[2]:-}"
+    PYTHON_KEYWORDS="${form_fields[3]:-}"
   fi
 
   # Author information
@@ -851,8 +1032,9 @@ configure_python_project() {
                         "Author Email:" 2 1 "your.email@example.com" 2 16 50 0)
   
   if [[ -n "$form_result" ]]; then
-    PYTHON_AUTHOR_NAME=$(echo "$form_result" | sed -n '1p')
-    PYTHON_AUTHOR_EMAIL=$(echo "$form_result" | sed -n '2p')
+    mapfile -t form_fields <<< "$form_result"
+    PYTHON_AUTHOR_NAME="${form_fields[0]:-}"
+    PYTHON_AUTHOR_EMAIL="${form_fields[1]:-}"
   fi
 
   # GitHub information for URLs
@@ -862,8 +1044,9 @@ configure_python_project() {
                         "GitHub Project:" 2 1 "${PYTHON_PROJECT_NAME:-my-awesome-project}" 2 17 40 0)
   
   if [[ -n "$form_result" ]]; then
-    PYTHON_GITHUB_USERNAME=$(echo "$form_result" | sed -n '1p')
-    PYTHON_GITHUB_PROJECT=$(echo "$form_result" | sed -n '2p')
+    mapfile -t form_fields <<< "$form_result"
+    PYTHON_GITHUB_USERNAME="${form_fields[0]:-}"
+    PYTHON_GITHUB_PROJECT="${form_fields[1]:-}"
   fi
 }
 
@@ -885,67 +1068,25 @@ configure_psi_header() {
     PSI_HEADER_COMPANY="My Company"
   fi
   
-  # Configure templates for each selected language
-  local available_languages=()
-  local language_descriptions=()
-  
-  # Determine which languages to configure based on selected tools
-  for tool in "${!TOOL_SELECTED[@]}"; do
-    if [[ "${TOOL_SELECTED[$tool]}" == "true" ]]; then
-      case "$tool" in
-        "go"|"golang")
-          available_languages+=("go")
-          language_descriptions+=("go" "Go programming language files")
-          ;;
-        "dotnet")
-          available_languages+=("csharp")
-          language_descriptions+=("csharp" "C# programming language files")
-          ;;
-        "node"|"pnpm"|"yarn"|"deno"|"bun")
-          available_languages+=("javascript" "typescript")
-          language_descriptions+=("javascript" "JavaScript files" "typescript" "TypeScript files")
-          ;;
-        "python")
-          available_languages+=("python")
-          language_descriptions+=("python" "Python programming language files")
-          ;;
-        "powershell")
-          available_languages+=("powershell")
-          language_descriptions+=("powershell" "PowerShell script files")
-          ;;
-        "opentofu")
-          available_languages+=("terraform")
-          language_descriptions+=("terraform" "Terraform/OpenTofu configuration files")
-          ;;
-      esac
-    fi
-  done
-  
-  # Always include common languages
-  available_languages+=("shellscript" "markdown")
-  language_descriptions+=("shellscript" "Shell/Bash script files" "markdown" "Markdown documentation files")
+  # Configure templates for the selected tools' languages plus the common ones
+  local available_languages=("${SELECTED_PSI_HEADER_LANGUAGES[@]}" "shellscript" "markdown")
   
   # Remove duplicates and sort
   mapfile -t available_languages < <(printf '%s\n' "${available_languages[@]}" | sort -u)
   
   # Configure templates for each language
+  local current_year
+  printf -v current_year '%(%Y)T' -1
+  # The copyright text is the same for every language, so build it once outside the loop
+  local copyright_text="Copyright © ${current_year} $PSI_HEADER_COMPANY. All rights reserved."
   for language in "${available_languages[@]}"; do
     local template_text
-    local default_template
-    default_template="Copyright © $(date +%Y) $PSI_HEADER_COMPANY. All rights reserved."
-    
-    case "$language" in
-      "powershell")
-        default_template=".DESCRIPTION - Copyright © $(date +%Y) $PSI_HEADER_COMPANY. All rights reserved."
-        ;;
-      "markdown")
-        default_template="Copyright © $(date +%Y) $PSI_HEADER_COMPANY. All rights reserved."
-        ;;
-    esac
-    
-    # Special instructions for PowerShell
+    local default_template="$copyright_text"
     local input_prompt="Enter the template text for $language files:\n\nThis text will be automatically added to the top of new $language files."
+    
+    # Special default and instructions for PowerShell
     if [[ "$language" == "powershell" ]]; then
+        default_template=".DESCRIPTION - $copyright_text"
         input_prompt="Enter the template text for PowerShell files:\n\nNote: For PowerShell, use '.DESCRIPTION - ' followed by your text.\nThe script will automatically format it correctly as:\n.DESCRIPTION\nYour text here"
     fi
     
@@ -974,14 +1115,16 @@ select_development_tools() {
   # Parse the .mise.toml file to discover sections and tools
   parse_mise_sections
   
+  # Version examples are looked up once per tool and reused by the version prompts,
+  # since fetching them runs mise ls-remote (possibly inside a container)
+  local -A tool_version_examples=()
+  
   # Process each section found in .mise.toml
   for section in "${INSTALL_SECTIONS[@]}"; do
-    local section_tools=()
-    
-    # Get tools for this section
-    while IFS= read -r tool; do
-      [[ -n "$tool" ]] && section_tools+=("$tool")
-    done < <(get_section_tools "$section")
+    # Get tools for this section straight from the parsed map; the global IFS splits on newlines and
+    # tool names are restricted to [a-zA-Z0-9_-] by parse_mise_sections
+    # shellcheck disable=SC2206
+    local section_tools=(${SECTION_TOOLS[$section]:-})
     
     # Skip empty sections
     if [[ ${#section_tools[@]} -eq 0 ]]; then
@@ -994,13 +1137,13 @@ select_development_tools() {
       # Build options for all tools in this section
       local tool_options=()
       for tool in "${section_tools[@]}"; do
-        local description
-        description=$(get_tool_description "$tool")
+        local description="${TOOL_DESCRIPTIONS[$tool]:-$tool - Development tool}"
         
         # Add version info to description for version-configurable tools
         if [[ "${TOOL_VERSION_CONFIGURABLE[$tool]:-false}" == "true" ]]; then
           local version_examples
           version_examples=$(get_latest_major_versions "$tool")
+          tool_version_examples["$tool"]="$version_examples"
           description="$description (version configurable $version_examples)"
         fi
         
@@ -1021,10 +1164,8 @@ select_development_tools() {
         
         # If this tool is version-configurable, ask for the version
         if [[ "${TOOL_VERSION_CONFIGURABLE[$tool]:-false}" == "true" ]]; then
-          local version_examples
-          version_examples=$(get_latest_major_versions "$tool")
-          local tool_desc
-          tool_desc=$(get_tool_description "$tool")
+          local version_examples="${tool_version_examples[$tool]:-}"
+          local tool_desc="${TOOL_DESCRIPTIONS[$tool]:-$tool - Development tool}"
           
           local version
           version=$(tui_input "$tool Configuration" \
@@ -1070,6 +1211,7 @@ select_development_tools() {
   fi
   
   # Configure PSI Header extension
+  collect_selected_tools
   configure_psi_header
 }
 
@@ -1092,22 +1234,13 @@ show_summary() {
   
   # Group tools by their sections
   for section in "${INSTALL_SECTIONS[@]}"; do
-    local section_tools=()
-    local section_has_selected=false
-    
-    # Get all tools in this section and check if any are selected
-    while IFS= read -r tool; do
-      if [[ -n "$tool" && "${TOOL_SELECTED[$tool]}" == "true" ]]; then
-        section_tools+=("$tool")
-        section_has_selected=true
-      fi
-    done < <(get_section_tools "$section")
+    collect_section_selected_tools "$section"
     
     # If this section has selected tools, add to summary
-    if [[ "$section_has_selected" == "true" && ${#section_tools[@]} -gt 0 ]]; then
+    if [[ ${#SECTION_SELECTED_TOOLS[@]} -gt 0 ]]; then
       tools_section+="  ✓ $section: "
       local tool_list=""
-      for tool in "${section_tools[@]}"; do
+      for tool in "${SECTION_SELECTED_TOOLS[@]}"; do
         local version="${TOOL_VERSION_VALUE[$tool]:-latest}"
         if [[ "$version" != "latest" ]]; then
           tool_list+="$tool ($version), "
@@ -1133,25 +1266,13 @@ show_summary() {
   local ext_count=0
   local ext_list=""
   
-  # Automatic extensions based on selected tools
-  for tool in "${!TOOL_SELECTED[@]}"; do
-    if [[ "${TOOL_SELECTED[$tool]}" == "true" ]]; then
-      case "$tool" in
-        "go") ext_list+="Go "; ((ext_count++)) ;;
-        "dotnet") ext_list+=".NET "; ((ext_count++)) ;;
-        "node") ext_list+="JavaScript/Node.js "; ((ext_count++)) ;;
-        "kubectl"|"helm"|"k9s") ext_list+="Kubernetes/Helm "; ((ext_count++)) ;;
-        "opentofu") ext_list+="Terraform/OpenTofu "; ((ext_count++)) ;;
-        "packer") ext_list+="Packer "; ((ext_count++)) ;;
-        "powershell") ext_list+="PowerShell "; ((ext_count++)) ;;
-      esac
-    fi
+  # Extensions for the selected tools and optional extensions, from the same lookup tables used for generation
+  collect_active_sections
+  local section
+  for section in "${ACTIVE_EXTENSION_SECTIONS[@]}"; do
+    ext_list+="$section "
+    ((ext_count++))
   done
-  
-  # Optional extensions selected by user
-  [[ "$INCLUDE_PYTHON_EXTENSIONS" == "true" ]] && { ext_list+="Python "; ((ext_count++)); }
-  [[ "$INCLUDE_MARKDOWN_EXTENSIONS" == "true" ]] && { ext_list+="Markdown "; ((ext_count++)); }
-  [[ "$INCLUDE_SHELL_EXTENSIONS" == "true" ]] && { ext_list+="Shell/Bash "; ((ext_count++)); }
   [[ "$INSTALL_PSI_HEADER" == "true" ]] && { ext_list+="PSI Header "; ((ext_count++)); }
   
   if [[ $ext_count -gt 0 ]]; then
@@ -1213,145 +1334,218 @@ create_project_directory() {
 # Import functions from original install.sh
 # These are the file generation and processing functions
 
-# Extract sections from .mise.toml
-extract_mise_section() {
-  local start_marker="$1"
-  local end_marker="$2"
-  local file=".mise.toml"
+# Tool descriptions for the tool checklists (hardcoded for now, could be enhanced later); tools not listed
+# fall back to "<tool> - Development tool"
+declare -A TOOL_DESCRIPTIONS=(
+  [opentofu]="OpenTofu - Open-source Terraform alternative"
+  [openbao]="OpenBao - Open-source Vault alternative"
+  [packer]="Packer - HashiCorp image builder"
+  [gitui]="gitui - Fast terminal UI for git repositories"
+  [tealdeer]="tealdeer - Fast implementation of tldr man pages"
+  [micro]="micro - Modern terminal-based text editor"
+  [powershell]="powershell - Microsoft PowerShell"
+  [cosign]="cosign - Container signing tool"
+  [kubectl]="kubectl - Kubernetes command-line tool"
+  [kubectx]="kubectx - Fast way to switch between clusters"
+  [kubens]="kubens - Fast way to switch between namespaces"
+  [k9s]="k9s - Terminal UI for Kubernetes clusters"
+  [helm]="Helm - The package manager for Kubernetes"
+  [krew]="krew - kubectl plugin manager"
+  [dive]="dive - Explore Docker image layers and optimize size"
+  [kubebench]="kubebench - CIS Kubernetes security benchmark"
+  [popeye]="popeye - Kubernetes cluster resource sanitizer"
+  [trivy]="trivy - Vulnerability scanner for containers & code"
+  [cmctl]="cmctl - CLI for cert-manager certificate management"
+  [k3d]="k3d - Lightweight Kubernetes for local development"
+  [golang]="golang - Go programming language"
+  [golangci-lint]="golangci-lint - Fast Go linters runner"
+  [goreleaser]="goreleaser - Release automation tool for Go projects"
+  [dotnet]="dotnet - .NET SDK"
+  [node]="node - Node.js JavaScript runtime"
+  [pnpm]="pnpm - Fast, disk space efficient package manager"
+  [yarn]="yarn - Popular alternative package manager"
+  [deno]="deno - Secure TypeScript/JavaScript runtime"
+  [bun]="bun - Fast all-in-one JavaScript runtime"
+)
+
+# Read devcontainer.json once per run (the template does not change while the installer runs), keep the
+# header before the extensions array and index each "// #### Begin <name> ####" ... "// #### End <name> ####" block by name
+load_devcontainer_sections() {
+  local file=".devcontainer/devcontainer.json"
+  local begin_regex='// #### Begin (.+) ####$'
+  local marker_regex='^[[:space:]]*//.*(Begin|End)'
+  local -a lines
+  local line
+  local section=""
+  local in_header=true
+  
+  if [[ "$DEVCONTAINER_LOADED_FILE" == "$file" ]]; then
+    return 0
+  fi
+  
+  DEVCONTAINER_SECTIONS=()
+  DEVCONTAINER_SECTION_BODIES=()
+  DEVCONTAINER_HEADER=""
+  
+  if [[ ! -f "$file" ]]; then
+    return 1
+  fi
   
-  # Use awk with proper handling of markers
-  awk -v start="$start_marker" -v end="$end_marker" '
-    $0 == start { found=1; next }
-    $0 == end { found=0; next }
-    found { print }
-  ' "$file"
+  # Read the whole file into an array, then scan it for the section markers
+  mapfile -t lines < "$file"
+  
+  for line in "${lines[@]}"; do
+    if [[ "$in_header" == true ]]; then
+      if [[ "$line" == '      "extensions": ['* ]]; then
+        in_header=false
+      else
+        DEVCONTAINER_HEADER+="$line"$'\n'
+      fi
+    fi
+    
+    if [[ -z "$section" && "$line" =~ $begin_regex ]]; then
+      section="${BASH_REMATCH[1]}"
+    fi
+    
+    if [[ -n "$section" ]]; then
+      DEVCONTAINER_SECTIONS["$section"]+="$line"$'\n'
+      if [[ ! "$line" =~ $marker_regex ]]; then
+        DEVCONTAINER_SECTION_BODIES["$section"]+="$line"$'\n'
+      fi
+      if [[ "$line" == *"// #### End ${section} ####" ]]; then
+        section=""
+      fi
+    fi
+  done
+  
+  DEVCONTAINER_LOADED_FILE="$file"
 }
 
-# Get tools from a specific section in .mise.toml
-get_tools_from_section() {
+# Print a section of devcontainer.json, including its marker comments, from the cache
+extract_devcontainer_section() {
   local section_name="$1"
-  local start_marker="#### Begin ${section_name} ####"
-  local end_marker="#### End ${section_name} ####"
-  
-  extract_mise_section "$start_marker" "$end_marker" | \
-    grep -E '^[a-zA-Z0-9_-]+\s*=' | \
-    grep -v '^#' | \
-    grep -v '^\[' | \
-    cut -d'=' -f1 | \
-    sed 's/[[:space:]]*$//' | \
-    sort
+  
+  printf '%s' "${DEVCONTAINER_SECTIONS[$section_name]:-}"
 }
 
-# Get tool description (hardcoded for now, could be enhanced later)
-get_tool_description() {
-  local tool="$1"
-  case "$tool" in
-    "opentofu") echo "OpenTofu - Open-source Terraform alternative" ;;
-    "openbao") echo "OpenBao - Open-source Vault alternative" ;;
-    "packer") echo "Packer - HashiCorp image builder" ;;
-    "gitui") echo "gitui - Fast terminal UI for git repositories" ;;
-    "tealdeer") echo "tealdeer - Fast implementation of tldr man pages" ;;
-    "micro") echo "micro - Modern terminal-based text editor" ;;
-    "powershell") echo "powershell - Microsoft PowerShell" ;;
-    "cosign") echo "cosign - Container signing tool" ;;
-    "kubectl") echo "kubectl - Kubernetes command-line tool" ;;
-    "kubectx") echo "kubectx - Fast way to switch between clusters" ;;
-    "kubens") echo "kubens - Fast way to switch between namespaces" ;;
-    "k9s") echo "k9s - Terminal UI for Kubernetes clusters" ;;
-    "helm") echo "Helm - The package manager for Kubernetes" ;;
-    "krew") echo "krew - kubectl plugin manager" ;;
-    "dive") echo "dive - Explore Docker image layers and optimize size" ;;
-    "kubebench") echo "kubebench - CIS Kubernetes security benchmark" ;;
-    "popeye") echo "popeye - Kubernetes cluster resource sanitizer" ;;
-    "trivy") echo "trivy - Vulnerability scanner for containers & code" ;;
-    "cmctl") echo "cmctl - CLI for cert-manager certificate management" ;;
-    "k3d") echo "k3d - Lightweight Kubernetes for local development" ;;
-    "golang") echo "golang - Go programming language" ;;
-    "golangci-lint") echo "golangci-lint - Fast Go linters runner" ;;
-    "goreleaser") echo "goreleaser - Release automation tool for Go projects" ;;
-    "dotnet") echo "dotnet - .NET SDK" ;;
-    "node") echo "node - Node.js JavaScript runtime" ;;
-    "pnpm") echo "pnpm - Fast, disk space efficient package manager" ;;
-    "yarn") echo "yarn - Popular alternative package manager" ;;
-    "deno") echo "deno - Secure TypeScript/JavaScript runtime" ;;
-    "bun") echo "bun - Fast all-in-one JavaScript runtime" ;;
-    *) echo "$tool - Development tool" ;;
-  esac
+# Print a section of devcontainer.json without its marker comments, from the cache
+extract_devcontainer_section_body() {
+  local section_name="$1"
+  
+  printf '%s' "${DEVCONTAINER_SECTION_BODIES[$section_name]:-}"
 }
 
-# Extract sections from devcontainer.json
-extract_devcontainer_section() {
-  local start_marker="$1"
-  local end_marker="$2"
-  local file=".devcontainer/devcontainer.json"
+# Collect the ordered, de-duplicated extension and settings sections for the selected tools and optional extensions
+collect_active_sections() {
+  local -A seen_extensions=()
+  local -A seen_settings=()
+  local tool section
+  local optional_sections=()
+  
+  ACTIVE_EXTENSION_SECTIONS=()
+  ACTIVE_SETTINGS_SECTIONS=()
+  
+  for tool in "${SELECTED_TOOLS[@]}"; do
+    section="${TOOL_EXTENSION_SECTIONS[$tool]:-}"
+    if [[ -n "$section" && -z "${seen_extensions[$section]:-}" ]]; then
+      seen_extensions["$section"]=true
+      ACTIVE_EXTENSION_SECTIONS+=("$section")
+    fi
+    section="${TOOL_SETTINGS_SECTIONS[$tool]:-}"
+    if [[ -n "$section" && -z "${seen_settings[$section]:-}" ]]; then
+      seen_settings["$section"]=true
+      ACTIVE_SETTINGS_SECTIONS+=("$section")
+    fi
+  done
   
-  if [[ ! -f "$file" ]]; then
-    return 1
+  # Optional extensions contribute both their extensions and their settings
+  if [[ "$INCLUDE_PYTHON_EXTENSIONS" == "true" ]]; then
+    optional_sections+=("Python")
+  fi
+  if [[ "$INCLUDE_MARKDOWN_EXTENSIONS" == "true" ]]; then
+    optional_sections+=("Markdown")
+  fi
+  if [[ "$INCLUDE_SHELL_EXTENSIONS" == "true" ]]; then
+    optional_sections+=("Shell/Bash")
   fi
   
-  # Escape forward slashes for sed pattern matching
-  local escaped_start_marker="${start_marker//\//\\/}"
-  local escaped_end_marker="${end_marker//\//\\/}"
-  
-  # Use sed to extract the specific section between exact markers
-  sed -n "/${escaped_start_marker}/,/${escaped_end_marker}/p" "$file"
+  for section in "${optional_sections[@]}"; do
+    if [[ -z "${seen_extensions[$section]:-}" ]]; then
+      seen_extensions["$section"]=true
+      ACTIVE_EXTENSION_SECTIONS+=("$section")
+    fi
+    if [[ -z "${seen_settings[$section]:-}" ]]; then
+      seen_settings["$section"]=true
+      ACTIVE_SETTINGS_SECTIONS+=("$section")
+    fi
+  done
+}
+
+# Append an extensions section to the generated devcontainer.json once, skipping sections already included
+append_extension_section() {
+  local section_name="$1"
+
+  if [[ -n "${INCLUDED_EXTENSION_SECTIONS[$section_name]:-}" ]]; then
+    echo "DEBUG: $section_name extensions already present, skipping" >&2
+    return 0
+  fi
+
+  INCLUDED_EXTENSION_SECTIONS["$section_name"]=true
+  echo ""
+  extract_devcontainer_section "$section_name"
+}
+
+# Append a "<name> Settings" section from devcontainer.json without its Begin/End marker comments
+append_settings_section() {
+  local section_name="$1"
+
+  extract_devcontainer_section_body "${section_name} Settings"
 }
 
 # Generate custom .mise.toml
 generate_mise_toml() {
   local project_path="$1"
   local temp_file="${project_path}/.mise.toml.tmp"
+  local section tool
   
-  # Start with the header and environment section from source
-  echo "# cspell:ignore cmctl gitui krew kubebench kubectx kubens direnv dotenv looztra kompiro kforsthoevel sarg kubeseal stefansedich nlamirault zufardhiyaulhaq sudermanjr" > "$temp_file"
-  # shellcheck disable=SC2129
-  extract_mise_section "#### Begin Environment" "#### End Environment" >> "$temp_file"
-  echo "" >> "$temp_file"
-  echo "[tools]" >> "$temp_file"
-  echo "" >> "$temp_file"
+  # Write the whole file through a single redirection
+  {
+    # Start with the header and environment section from source
+    echo "# cspell:ignore cmctl gitui krew kubebench kubectx kubens direnv dotenv looztra kompiro kforsthoevel sarg kubeseal stefansedich nlamirault zufardhiyaulhaq sudermanjr"
+    printf '%s' "$MISE_ENVIRONMENT_SECTION"
+    echo ""
+    echo "[tools]"
+    echo ""
 
-  # Generate sections based on selected tools and their sections
-  for section in "${INSTALL_SECTIONS[@]}"; do
-    local section_has_tools=false
-    local section_tools=()
-    
-    # Collect selected tools for this section
-    while IFS= read -r tool; do
-      if [[ -n "$tool" && "${TOOL_SELECTED[$tool]}" == "true" ]]; then
-        section_tools+=("$tool")
-        section_has_tools=true
-      fi
-    done < <(get_section_tools "$section")
-    
-    # If section has selected tools, generate the section
-    if [[ "$section_has_tools" == "true" && ${#section_tools[@]} -gt 0 ]]; then
-      echo "#### Begin $section" >> "$temp_file"
-      
-      for tool in "${section_tools[@]}"; do
-        local version="${TOOL_VERSION_VALUE[$tool]:-latest}"
-        echo "$tool = \"$version\"" >> "$temp_file"
-      done
+    # Generate sections based on selected tools and their sections
+    for section in "${INSTALL_SECTIONS[@]}"; do
+      collect_section_selected_tools "$section"
       
-      echo "#### End $section" >> "$temp_file"
-      echo "" >> "$temp_file"
-    fi
-  done
+      # If section has selected tools, generate the section
+      if [[ ${#SECTION_SELECTED_TOOLS[@]} -gt 0 ]]; then
+        echo "#### Begin $section"
+        
+        for tool in "${SECTION_SELECTED_TOOLS[@]}"; do
+          local version="${TOOL_VERSION_VALUE[$tool]:-latest}"
+          echo "$tool = \"$version\""
+        done
+        
+        echo "#### End $section"
+        echo ""
+      fi
+    done
 
-  # Add alias section from source (if it exists)
-  if grep -q "^\[alias\]" .mise.toml; then
-    echo "" >> "$temp_file"
-    # Extract everything from [alias] to the next section or end of file
-    awk '/^\[alias\]/{found=1} found && /^\[/ && !/^\[alias\]/{found=0} found{print}' .mise.toml >> "$temp_file"
-  fi
-  
-  # Add settings section from source (if it exists)  
-  if grep -q "^\[settings\]" .mise.toml; then
-    echo "" >> "$temp_file"
-    # Extract everything from [settings] to the end of file
-    awk '/^\[settings\]/{found=1} found{print}' .mise.toml >> "$temp_file"
-  fi
+    # Add the alias section (from [alias] to the next section) and the settings section (from [settings]
+    # to the end of file) recorded by parse_mise_sections, each preceded by a blank line only if it exists
+    if [[ -n "$MISE_ALIAS_SECTION" ]]; then
+      printf '\n%s' "$MISE_ALIAS_SECTION"
+    fi
+    if [[ -n "$MISE_SETTINGS_SECTION" ]]; then
+      printf '\n%s' "$MISE_SETTINGS_SECTION"
+    fi
+  } > "$temp_file"
 
-  mv "$temp_file" "${project_path}/.mise.toml"
+  move_if_changed "$temp_file" "${project_path}/.mise.toml"
 }
 
 # Update dev.sh with project settings
@@ -1362,15 +1556,17 @@ update_dev_sh() {
   local container_name="$4"
   local temp_file="${project_path}/dev.sh.tmp"
   
-  # Copy dev.sh and update the variables
-  cp "dev.sh" "$temp_file"
+  docker_exec_command=$(escape_sed_replacement "$docker_exec_command")
+  project_name=$(escape_sed_replacement "$project_name")
+  container_name=$(escape_sed_replacement "$container_name")
   
-  # Update the variables at the top of the file
-  sed_inplace "s/docker_exec_command=\"[^\"]*\"/docker_exec_command=\"${docker_exec_command}\"/" "$temp_file"
-  sed_inplace "s/project_name=\"[^\"]*\"/project_name=\"${project_name}\"/" "$temp_file"
-  sed_inplace "s/container_name=\"[^\"]*\"/container_name=\"${container_name}\"/" "$temp_file"
+  # Update the variables at the top of the file in a single pass from the template
+  sed -e "s|docker_exec_command=\"[^\"]*\"|docker_exec_command=\"${docker_exec_command}\"|" \
+      -e "s|project_name=\"[^\"]*\"|project_name=\"${project_name}\"|" \
+      -e "s|container_name=\"[^\"]*\"|container_name=\"${container_name}\"|" \
+      "dev.sh" > "$temp_file"
   
-  mv "$temp_file" "${project_path}/dev.sh"
+  move_if_changed "$temp_file" "${project_path}/dev.sh"
   chmod +x "${project_path}/dev.sh"
 }
 
@@ -1378,26 +1574,26 @@ update_dev_sh() {
 generate_hatch_publish_section() {
   local pyproject_file="$1"
   
-  # Find the start and end of the Hatch publish section
-  local start_line end_line
-  start_line=$(grep -n "^# Hatch publish configuration for package repositories" "$pyproject_file" | cut -d: -f1)
-  end_line=$(grep -n "^# Development environment configuration for Hatch" "$pyproject_file" | cut -d: -f1)
+  # Read the file once and find the start and end of the Hatch publish section
+  local -a lines
+  local i start_index="" end_index=""
+  mapfile -t lines < "$pyproject_file"
+  for i in "${!lines[@]}"; do
+    if [[ -z "$start_index" && "${lines[i]}" == "# Hatch publish configuration for package repositories"* ]]; then
+      start_index=$i
+    elif [[ -z "$end_index" && "${lines[i]}" == "# Development environment configuration for Hatch"* ]]; then
+      end_index=$i
+      break
+    fi
+  done
   
-  if [[ -n "$start_line" && -n "$end_line" ]]; then
-    # Create the new hatch publish section content
+  if [[ -n "$start_index" && -n "$end_index" ]]; then
+    # Build the repository entries for the selected type, then compose the section once
+    local repos_content=""
+    local credential_prefix=""
     local new_content=""
     case "$PYTHON_REPOSITORY_TYPE" in
       "pypi")
-        new_content="# Hatch publish configuration for package repositories
-[tool.hatch.publish.index]
-disable = false
-
-# Authentication Note:
-# Set these environment variables for repository authentication:
-#   export HATCH_INDEX_USER=your_username
-#   export HATCH_INDEX_AUTH=your_password_or_token
-
-"
         ;;
       "artifactory")
         # Extract base URL and repository names from the configured URLs
@@ -1405,22 +1601,14 @@ disable = false
         local dev_repo_name="${PYTHON_INDEX_URL##*/simple}"
         dev_repo_name="${dev_repo_name%/simple}"
         local prod_repo_name="${dev_repo_name%${PYTHON_DEV_SUFFIX}}"
+        credential_prefix="artifactory_"
         
-        new_content="# Hatch publish configuration for package repositories
-[tool.hatch.publish.index.repos.${prod_repo_name}${PYTHON_DEV_SUFFIX}]
+        repos_content="[tool.hatch.publish.index.repos.${prod_repo_name}${PYTHON_DEV_SUFFIX}]
 url = \"${base_url}/artifactory/api/pypi/${prod_repo_name}${PYTHON_DEV_SUFFIX}/simple/\"
 
 [tool.hatch.publish.index.repos.${prod_repo_name}${PYTHON_PROD_SUFFIX}]
 url = \"${base_url}/artifactory/api/pypi/${prod_repo_name}${PYTHON_PROD_SUFFIX}/simple/\"
 
-[tool.hatch.publish.index]
-disable = false
-
-# Authentication Note:
-# Set these environment variables for repository authentication:
-#   export HATCH_INDEX_USER=your_artifactory_username
-#   export HATCH_INDEX_AUTH=your_artifactory_password_or_token
-
 "
         ;;
       "nexus")
@@ -1429,55 +1617,105 @@ disable = false
         local repo_name="${PYTHON_PUBLISH_URL##*/repository/}"
         repo_name="${repo_name%/}"
         local base_repo_name="${repo_name%${PYTHON_DEV_SUFFIX}}"
+        credential_prefix="nexus_"
         
-        new_content="# Hatch publish configuration for package repositories
-[tool.hatch.publish.index.repos.${base_repo_name}${PYTHON_DEV_SUFFIX}]
+        repos_content="[tool.hatch.publish.index.repos.${base_repo_name}${PYTHON_DEV_SUFFIX}]
 url = \"${base_url}/repository/${base_repo_name}${PYTHON_DEV_SUFFIX}/simple/\"
 
 [tool.hatch.publish.index.repos.${base_repo_name}${PYTHON_PROD_SUFFIX}]
 url = \"${base_url}/repository/${base_repo_name}${PYTHON_PROD_SUFFIX}/simple/\"
 
-[tool.hatch.publish.index]
-disable = false
-
-# Authentication Note:
-# Set these environment variables for repository authentication:
-#   export HATCH_INDEX_USER=your_nexus_username
-#   export HATCH_INDEX_AUTH=your_nexus_password_or_token
-
 "
         ;;
       "custom")
-        new_content="# Hatch publish configuration for package repositories
-[tool.hatch.publish.index.repos.custom${PYTHON_DEV_SUFFIX}]
+        repos_content="[tool.hatch.publish.index.repos.custom${PYTHON_DEV_SUFFIX}]
 url = \"${PYTHON_INDEX_URL}\"
 
 [tool.hatch.publish.index.repos.custom${PYTHON_PROD_SUFFIX}]
 url = \"${PYTHON_EXTRA_INDEX_URL:-$PYTHON_INDEX_URL}\"
 
-[tool.hatch.publish.index]
+"
+        ;;
+    esac
+    
+    case "$PYTHON_REPOSITORY_TYPE" in
+      "pypi"|"artifactory"|"nexus"|"custom")
+        new_content="# Hatch publish configuration for package repositories
+${repos_content}[tool.hatch.publish.index]
 disable = false
 
 # Authentication Note:
 # Set these environment variables for repository authentication:
-#   export HATCH_INDEX_USER=your_username
-#   export HATCH_INDEX_AUTH=your_password_or_token
+#   export HATCH_INDEX_USER=your_${credential_prefix}username
+#   export HATCH_INDEX_AUTH=your_${credential_prefix}password_or_token
 
 "
         ;;
     esac
     
-    # Create a temporary file with the replacement content
+    # Write the lines before the section, the replacement content and the remaining lines in one go
     local temp_file="${pyproject_file}.tmp"
-    head -n $((start_line - 1)) "$pyproject_file" > "$temp_file"
-    echo -n "$new_content" >> "$temp_file"
-    tail -n +$((end_line)) "$pyproject_file" >> "$temp_file"
+    {
+      if ((start_index > 0)); then
+        printf '%s\n' "${lines[@]:0:start_index}"
+      fi
+      printf '%s' "$new_content"
+      printf '%s\n' "${lines[@]:end_index}"
+    } > "$temp_file"
     
     # Replace the original file
-    mv "$temp_file" "$pyproject_file"
+    move_if_changed "$temp_file" "$pyproject_file"
   fi
 }
 
+# Convert a project name to a Python package name (lowercase, underscores, alphanumeric only) into
+# PYTHON_PACKAGE_NAME. Call it directly, not in a command substitution, or the result is lost
+python_package_name() {
+  # The same project name is converted for pyproject.toml and again for the completion message
+  if [[ -n "$PYTHON_PACKAGE_NAME" && "$1" == "$PYTHON_PACKAGE_NAME_SOURCE" ]]; then
+    return 0
+  fi
+  
+  local package_name="${1,,}"
+  package_name="${package_name//[^a-z0-9]/_}"
+  while [[ "$package_name" == *__* ]]; do
+    package_name="${package_name//__/_}"
+  done
+  package_name="${package_name#_}"
+  package_name="${package_name%_}"
+  
+  # Ensure package name is valid (starts with letter, no consecutive underscores)
+  if [[ ! "$package_name" =~ ^[a-z][a-z0-9_]*$ ]]; then
+    package_name="my_${package_name}"
+  fi
+  PYTHON_PACKAGE_NAME_SOURCE="$1"
+  PYTHON_PACKAGE_NAME="$package_name"
+}
+
+# Escape a string for use inside a JSON string literal (pure bash, no subprocesses)
+json_escape() {
+  local value="$1"
+  value="${value//\\/\\\\}"
+  value="${value//\"/\\\"}"
+  value="${value//$'\n'/\\n}"
+  value="${value//©/\\u00A9}"
+  printf '%s' "$value"
+}
+
+# Print one psi-header lang-config entry, defaulting to "//" line comments for languages not in the syntax table
+write_psi_header_lang_config() {
+  local language="$1"
+  local separator="$2"
+  local syntax="${PSI_HEADER_LANG_SYNTAX[$language]:-||// }"
+  local begin="${syntax%%|*}"
+  local rest="${syntax#*|}"
+  local end="${rest%%|*}"
+  local prefix="${rest#*|}"
+  
+  printf '          {\n            "language": "%s",\n            "begin": "%s",\n            "end": "%s",\n            "prefix": "%s"\n          }%s\n' \
+    "$language" "$begin" "$end" "$prefix" "$separator"
+}
+
 # Generate custom PSI Header settings
 generate_psi_header_settings() {
   local temp_file="$1"
@@ -1486,282 +1724,136 @@ generate_psi_header_settings() {
   echo "DEBUG: PSI_HEADER_COMPANY: $PSI_HEADER_COMPANY" >&2
   echo "DEBUG: PSI_HEADER_TEMPLATES array length: ${#PSI_HEADER_TEMPLATES[@]}" >&2
   
-  # Add PSI Header settings comment
-  echo "DEBUG: Adding PSI Header settings comment" >&2
-  echo '        // #### Begin PSI Header Settings ####' >> "$temp_file"
-  
-  # Company configuration - escape quotes in company name
-  echo "DEBUG: Adding company configuration" >&2
-  local escaped_company
-  escaped_company=$(echo "$PSI_HEADER_COMPANY" | sed 's/"/\\"/g')
-  echo '        "psi-header.config": {' >> "$temp_file"
-  echo "          \"company\": \"$escaped_company\"" >> "$temp_file"
-  echo '        },' >> "$temp_file"
-  
-  # Changes tracking configuration
-  echo "DEBUG: Adding changes tracking configuration" >&2
-  echo '        "psi-header.changes-tracking": {' >> "$temp_file"
-  echo '          "autoHeader": "autoSave",' >> "$temp_file"
-  echo '          "exclude": ["json"],' >> "$temp_file"
-  echo '          "excludeGlob": ["**/.git/**"]' >> "$temp_file"
-  echo '        },' >> "$temp_file"
-  
-  # Project creation year (current year)
-  echo "DEBUG: Adding project creation year" >&2
-  local current_year
-  current_year=$(date +%Y)
-  echo "        \"psi-header.variables\": [[\"projectCreationYear\", \"$current_year\"]]," >> "$temp_file"
-  
-  # Language configurations - include all available languages from the devcontainer.json
-  echo "DEBUG: Starting language configurations" >&2
-  echo '        "psi-header.lang-config": [' >> "$temp_file"
-  
-  # Default configuration for all languages
-  echo '          {' >> "$temp_file"
-  echo '            "language": "*",' >> "$temp_file"
-  echo '            "begin": "",' >> "$temp_file"
-  echo '            "end": "",' >> "$temp_file"
-  echo '            "prefix": "// "' >> "$temp_file"
-  echo '          },' >> "$temp_file"
-  
-  # Add language-specific configurations only if tools are selected
-  local added_languages=()
-  
-  # Helper function to check if language is already added
-  language_already_added() {
-    local lang="$1"
-    local element
-    for element in "${added_languages[@]}"; do
-      [[ "$element" == "$lang" ]] && return 0
-    done
-    return 1
-  }
-  
-  for tool in "${!TOOL_SELECTED[@]}"; do
-    if [[ "${TOOL_SELECTED[$tool]}" == "true" ]]; then
-      case "$tool" in
-        "go"|"golang")
-          if ! language_already_added "go"; then
-            echo '          {' >> "$temp_file"
-            echo '            "language": "go",' >> "$temp_file"
-            echo '            "begin": "",' >> "$temp_file"
-            echo '            "end": "",' >> "$temp_file"
-            echo '            "prefix": "// "' >> "$temp_file"
-            echo '          },' >> "$temp_file"
-            added_languages+=("go")
-          fi
-          ;;
-        "dotnet")
-          if ! language_already_added "csharp"; then
-            echo '          {' >> "$temp_file"
-            echo '            "language": "csharp",' >> "$temp_file"
-            echo '            "begin": "",' >> "$temp_file"
-            echo '            "end": "",' >> "$temp_file"
-            echo '            "prefix": "// "' >> "$temp_file"
-            echo '          },' >> "$temp_file"
-            added_languages+=("csharp")
-          fi
-          ;;
-        "node"|"pnpm"|"yarn"|"deno"|"bun")
-          if ! language_already_added "javascript"; then
-            echo '          {' >> "$temp_file"
-            echo '            "language": "javascript",' >> "$temp_file"
-            echo '            "begin": "",' >> "$temp_file"
-            echo '            "end": "",' >> "$temp_file"
-            echo '            "prefix": "// "' >> "$temp_file"
-            echo '          },' >> "$temp_file"
-            added_languages+=("javascript")
-          fi
-          if ! language_already_added "typescript"; then
-            echo '          {' >> "$temp_file"
-            echo '            "language": "typescript",' >> "$temp_file"
-            echo '            "begin": "",' >> "$temp_file"
-            echo '            "end": "",' >> "$temp_file"
-            echo '            "prefix": "// "' >> "$temp_file"
-            echo '          },' >> "$temp_file"
-            added_languages+=("typescript")
-          fi
-          ;;
-        "python")
-          if ! language_already_added "python"; then
-            echo '          {' >> "$temp_file"
-            echo '            "language": "python",' >> "$temp_file"
-            echo '            "begin": "",' >> "$temp_file"
-            echo '            "end": "",' >> "$temp_file"
-            echo '            "prefix": "# "' >> "$temp_file"
-            echo '          },' >> "$temp_file"
-            added_languages+=("python")
-          fi
-          ;;
-        "powershell")
-          if ! language_already_added "powershell"; then
-            echo '          {' >> "$temp_file"
-            echo '            "language": "powershell",' >> "$temp_file"
-            echo '            "begin": "<#",' >> "$temp_file"
-            echo '            "end": "#>",' >> "$temp_file"
-            echo '            "prefix": ""' >> "$temp_file"
-            echo '          },' >> "$temp_file"
-            added_languages+=("powershell")
-          fi
-          ;;
-        "opentofu")
-          if ! language_already_added "terraform"; then
-            echo '          {' >> "$temp_file"
-            echo '            "language": "terraform",' >> "$temp_file"
-            echo '            "begin": "",' >> "$temp_file"
-            echo '            "end": "",' >> "$temp_file"
-            echo '            "prefix": "# "' >> "$temp_file"
-            echo '          },' >> "$temp_file"
-            added_languages+=("terraform")
-          fi
-          ;;
-      esac
+  # Everything below goes to the temp file through a single append redirection
+  {
+    # The settings comment, company and changes-tracking configuration, project creation year (current year)
+    # and the default configuration for all languages are fixed text apart from the company and the year,
+    # so they are written with one printf
+    echo "DEBUG: Adding PSI Header comment, company, changes tracking, creation year and default language" >&2
+    local escaped_company current_year
+    escaped_company=$(json_escape "$PSI_HEADER_COMPANY")
+    printf -v current_year '%(%Y)T' -1
+    printf '%s\n' \
+      '        // #### Begin PSI Header Settings ####' \
+      '        "psi-header.config": {' \
+      "          \"company\": \"$escaped_company\"" \
+      '        },' \
+      '        "psi-header.changes-tracking": {' \
+      '          "autoHeader": "autoSave",' \
+      '          "exclude": ["json"],' \
+      '          "excludeGlob": ["**/.git/**"]' \
+      '        },' \
+      "        \"psi-header.variables\": [[\"projectCreationYear\", \"$current_year\"]]," \
+      '        "psi-header.lang-config": [' \
+      '          {' \
+      '            "language": "*",' \
+      '            "begin": "",' \
+      '            "end": "",' \
+      '            "prefix": "// "' \
+      '          },'
+  
+    # Add language-specific configurations only if tools are selected, then the common languages
+    local languages=("${SELECTED_PSI_HEADER_LANGUAGES[@]}")
+    languages+=("dockerfile" "shellscript")
+    if [[ "$INCLUDE_MARKDOWN_EXTENSIONS" == "true" ]]; then
+      languages+=("markdown")
     fi
-  done
+    languages+=("yaml" "env")
   
-  # Always include common languages
-  if ! language_already_added "dockerfile"; then
-    echo '          {' >> "$temp_file"
-    echo '            "language": "dockerfile",' >> "$temp_file"
-    echo '            "begin": "",' >> "$temp_file"
-    echo '            "end": "",' >> "$temp_file"
-    echo '            "prefix": "# "' >> "$temp_file"
-    echo '          },' >> "$temp_file"
-    added_languages+=("dockerfile")
-  fi
-  
-  # Always include shellscript since shell scripts are common in dev environments
-  if ! language_already_added "shellscript"; then
-    echo '          {' >> "$temp_file"
-    echo '            "language": "shellscript",' >> "$temp_file"
-    echo '            "begin": "",' >> "$temp_file"
-    echo '            "end": "",' >> "$temp_file"
-    echo '            "prefix": "# "' >> "$temp_file"
-    echo '          },' >> "$temp_file"
-    added_languages+=("shellscript")
-  fi
-  
-  if [[ "$INCLUDE_MARKDOWN_EXTENSIONS" == "true" ]] && ! language_already_added "markdown"; then
-    echo '          {' >> "$temp_file"
-    echo '            "language": "markdown",' >> "$temp_file"
-    echo '            "begin": "",' >> "$temp_file"
-    echo '            "end": "",' >> "$temp_file"
-    echo '            "prefix": "> "' >> "$temp_file"
-    echo '          },' >> "$temp_file"
-    added_languages+=("markdown")
-  fi
-  
-  # Always include YAML and env files
-  if ! language_already_added "yaml"; then
-    echo '          {' >> "$temp_file"
-    echo '            "language": "yaml",' >> "$temp_file"
-    echo '            "begin": "",' >> "$temp_file"
-    echo '            "end": "",' >> "$temp_file"
-    echo '            "prefix": "# "' >> "$temp_file"
-    echo '          },' >> "$temp_file"
-    added_languages+=("yaml")
-  fi
-  
-  if ! language_already_added "env"; then
-    echo '          {' >> "$temp_file"
-    echo '            "language": "env",' >> "$temp_file"
-    echo '            "begin": "",' >> "$temp_file"
-    echo '            "end": "",' >> "$temp_file"
-    echo '            "prefix": "# "' >> "$temp_file"
-    echo '          }' >> "$temp_file"
-    added_languages+=("env")
-  fi
-  
-  echo '        ],' >> "$temp_file"
-  
-  # Generate templates section
-  echo "DEBUG: Starting templates section" >&2
-  echo '        "psi-header.templates": [' >> "$temp_file"
-  
-  local template_count=0
-  echo "DEBUG: Initialized template_count to: $template_count" >&2
-  
-  # Only iterate if array has elements
-  if [[ ${#PSI_HEADER_TEMPLATES[@]} -gt 0 ]]; then
-    echo "DEBUG: Processing ${#PSI_HEADER_TEMPLATES[@]} custom templates" >&2
-    for template_entry in "${PSI_HEADER_TEMPLATES[@]}"; do
-      echo "DEBUG: Processing template entry: $template_entry" >&2
-      local language="${template_entry%%|||*}"
-      local template_text="${template_entry#*|||}"
-      echo "DEBUG: Extracted language: $language" >&2
-      echo "DEBUG: Extracted template_text: $template_text" >&2
-      
-      # Escape quotes and newlines in template text for JSON
-      echo "DEBUG: Starting template text escaping" >&2
-      local escaped_template
-      # First escape backslashes, then quotes, then handle newlines, then copyright symbol
-      escaped_template=$(echo "$template_text" | sed 's/\\/\\\\/g' | sed 's/"/\\"/g' | sed ':a;N;$!ba;s/\n/\\n/g' | sed 's/©/\\u00A9/g')
-      echo "DEBUG: Escaped template: $escaped_template" >&2
-      
-      if [[ $template_count -gt 0 ]]; then
-        echo "DEBUG: Adding comma separator" >&2
-        echo ',' >> "$temp_file"
+    local i separator
+    for i in "${!languages[@]}"; do
+      separator=","
+      if [[ $i -eq $((${#languages[@]} - 1)) ]]; then
+        separator=""
       fi
+      write_psi_header_lang_config "${languages[i]}" "$separator"
+    done
+  
+    echo '        ],'
+  
+    # Generate templates section
+    echo "DEBUG: Starting templates section" >&2
+    echo '        "psi-header.templates": ['
+  
+    local template_count=0
+    local template_separator=""
+    echo "DEBUG: Initialized template_count to: $template_count" >&2
+  
+    # Only iterate if array has elements
+    if [[ ${#PSI_HEADER_TEMPLATES[@]} -gt 0 ]]; then
+      echo "DEBUG: Processing ${#PSI_HEADER_TEMPLATES[@]} custom templates" >&2
+      for template_entry in "${PSI_HEADER_TEMPLATES[@]}"; do
+        echo "DEBUG: Processing template entry: $template_entry" >&2
+        local language="${template_entry%%|||*}"
+        local template_text="${template_entry#*|||}"
+        local template_value
+        echo "DEBUG: Extracted language: $language" >&2
+        echo "DEBUG: Extracted template_text: $template_text" >&2
       
-      echo "DEBUG: Adding template JSON structure" >&2
-      echo '          {' >> "$temp_file"
-      echo "            \"language\": \"$language\"," >> "$temp_file"
-      
-      # Handle PowerShell special case with .DESCRIPTION
-      if [[ "$language" == "powershell" && "$template_text" == *".DESCRIPTION"* ]]; then
-        echo "DEBUG: Processing PowerShell special case" >&2
-        # Split .DESCRIPTION and content for PowerShell
-        local description_part
-        local content_part
-        description_part=$(echo "$template_text" | head -n1)
-        content_part=$(echo "$template_text" | tail -n+2)
+        # Handle PowerShell special case with .DESCRIPTION
+        if [[ "$language" == "powershell" && "$template_text" == *".DESCRIPTION"* ]]; then
+          echo "DEBUG: Processing PowerShell special case" >&2
+          # Split .DESCRIPTION and content for PowerShell
+          local description_part
+          local content_part
+          description_part="${template_text%%$'\n'*}"
+          content_part=""
+          [[ "$template_text" == *$'\n'* ]] && content_part="${template_text#*$'\n'}"
         
-        # Escape each part separately
-        local escaped_description
-        local escaped_content
-        escaped_description=$(echo "$description_part" | sed 's/\\/\\\\/g' | sed 's/"/\\"/g' | sed 's/©/\\u00A9/g')
-        escaped_content=$(echo "$content_part" | sed 's/\\/\\\\/g' | sed 's/"/\\"/g' | sed 's/©/\\u00A9/g')
+          # Escape each part separately
+          local escaped_description
+          local escaped_content
+          escaped_description=$(json_escape "$description_part")
+          escaped_content=$(json_escape "$content_part")
         
-        echo "            \"template\": [\"$escaped_description\", \"$escaped_content\"]" >> "$temp_file"
-      else
-        echo "DEBUG: Processing regular template" >&2
-        echo "            \"template\": [\"$escaped_template\"]" >> "$temp_file"
-      fi
+          template_value="\"$escaped_description\", \"$escaped_content\""
+        else
+          echo "DEBUG: Processing regular template" >&2
+          # Escape quotes and newlines in template text for JSON; the PowerShell branch escapes its parts instead
+          local escaped_template
+          escaped_template=$(json_escape "$template_text")
+          echo "DEBUG: Escaped template: $escaped_template" >&2
+          template_value="\"$escaped_template\""
+        fi
       
-      echo "DEBUG: Closing template JSON structure" >&2
-      echo -n '          }' >> "$temp_file"
+        # Write the whole entry, preceded by the comma separator after the first one, with a single printf
+        echo "DEBUG: Adding template JSON structure" >&2
+        printf '%s          {\n            "language": "%s",\n            "template": [%s]\n          }' \
+          "$template_separator" "$language" "$template_value"
+        template_separator=$',\n'
       
-      echo "DEBUG: Incrementing template count" >&2
-      template_count=$((template_count + 1))
-      echo "DEBUG: Template count is now: $template_count" >&2
-      echo "DEBUG: Completed processing template for language: $language" >&2
-    done
-    echo "DEBUG: Finished processing all templates" >&2
-  else
-    echo "DEBUG: No custom templates found, PSI_HEADER_TEMPLATES array is empty" >&2
-  fi
-  echo "DEBUG: Template processing section completed" >&2
-  
-  # Add default template if no custom templates were configured
-  if [[ $template_count -eq 0 ]]; then
-    echo "DEBUG: Adding default template since no custom templates were configured" >&2
-    local default_template_text
-    local escaped_default
-    default_template_text="Copyright © $(date +%Y) $PSI_HEADER_COMPANY. All rights reserved."
-    escaped_default=$(echo "$default_template_text" | sed 's/\\/\\\\/g' | sed 's/"/\\"/g' | sed 's/©/\\u00A9/g')
+        echo "DEBUG: Incrementing template count" >&2
+        template_count=$((template_count + 1))
+        echo "DEBUG: Template count is now: $template_count" >&2
+        echo "DEBUG: Completed processing template for language: $language" >&2
+      done
+      echo "DEBUG: Finished processing all templates" >&2
+    else
+      echo "DEBUG: No custom templates found, PSI_HEADER_TEMPLATES array is empty" >&2
+    fi
+    echo "DEBUG: Template processing section completed" >&2
+  
+    # Add default template if no custom templates were configured
+    if [[ $template_count -eq 0 ]]; then
+      echo "DEBUG: Adding default template since no custom templates were configured" >&2
+      local default_template_text
+      local escaped_default
+      default_template_text="Copyright © ${current_year} $PSI_HEADER_COMPANY. All rights reserved."
+      escaped_default=$(json_escape "$default_template_text")
     
-    echo '          {' >> "$temp_file"
-    echo '            "language": "*",' >> "$temp_file"
-    echo "            \"template\": [\"$escaped_default\"]" >> "$temp_file"
-    echo '          }' >> "$temp_file"
-  else
-    echo "DEBUG: Using custom templates, adding newline" >&2
-    echo '' >> "$temp_file"
-  fi
+      echo '          {'
+      echo '            "language": "*",'
+      echo "            \"template\": [\"$escaped_default\"]"
+      echo '          }'
+    else
+      echo "DEBUG: Using custom templates, adding newline" >&2
+      echo ''
+    fi
   
-  echo "DEBUG: Closing templates section" >&2
-  echo '        ]' >> "$temp_file"
-  echo '        // #### End PSI Header Settings ####' >> "$temp_file"
+    echo "DEBUG: Closing templates section" >&2
+    echo '        ]'
+    echo '        // #### End PSI Header Settings ####'
+  } >> "$temp_file"
   echo "DEBUG: generate_psi_header_settings function completed successfully" >&2
 }
 
@@ -1780,20 +1872,28 @@ update_pyproject_toml() {
     generate_hatch_publish_section "$pyproject_file"
   fi
 
+  # Nothing else to do when no project metadata was provided
+  if [[ -z "${PYTHON_PROJECT_NAME}${PYTHON_PROJECT_DESCRIPTION}${PYTHON_LICENSE}${PYTHON_KEYWORDS}" ]] && \
+     [[ -z "$PYTHON_AUTHOR_NAME" || -z "$PYTHON_AUTHOR_EMAIL" ]] && \
+     [[ -z "$PYTHON_GITHUB_USERNAME" || -z "$PYTHON_GITHUB_PROJECT" ]]; then
+    return
+  fi
+
+  # Substitutions are collected here and applied in a single sed pass at the end
+  # Each value is escaped in the branch that substitutes it
+  local sed_expressions=()
+  local project_name description license author_name author_email
+
   # Update project metadata if provided
   if [[ -n "$PYTHON_PROJECT_NAME" ]]; then
-    # Convert project name to package name (lowercase, underscores, alphanumeric only)
     local package_name
-    package_name=$(echo "$PYTHON_PROJECT_NAME" | tr '[:upper:]' '[:lower:]' | sed 's/[^a-z0-9]/_/g' | sed 's/_\+/_/g' | sed 's/^_\|_$//g')
-    
-    # Ensure package name is valid (starts with letter, no consecutive underscores)
-    if [[ ! "$package_name" =~ ^[a-z][a-z0-9_]*$ ]]; then
-      package_name="my_${package_name}"
-    fi
+    project_name=$(escape_sed_replacement "$PYTHON_PROJECT_NAME")
+    python_package_name "$PYTHON_PROJECT_NAME"
+    package_name="$PYTHON_PACKAGE_NAME"
     
     # Update project name and package references
-    sed_inplace "s|name = \"my-awesome-project\"|name = \"$PYTHON_PROJECT_NAME\"|" "$pyproject_file"
-    sed_inplace "s|my_awesome_project|$package_name|g" "$pyproject_file"
+    sed_expressions+=(-e "s|name = \"my-awesome-project\"|name = \"$project_name\"|")
+    sed_expressions+=(-e "s|my_awesome_project|$package_name|g")
     
     # Create the package directory structure
     mkdir -p "${project_path}/src/${package_name}"
@@ -1801,36 +1901,56 @@ update_pyproject_toml() {
     echo "# ${PYTHON_PROJECT_DESCRIPTION:-$PYTHON_PROJECT_NAME}" > "${project_path}/src/${package_name}/__init__.py"
   fi
 
-  # Update project description
-  if [[ -n "$PYTHON_PROJECT_DESCRIPTION" ]]; then
-    sed_inplace "s|description = \"A brief description of your project\"|description = \"$PYTHON_PROJECT_DESCRIPTION\"|" "$pyproject_file"
+  # Update project description (the form defaults already match the template, so those values are skipped)
+  if [[ -n "$PYTHON_PROJECT_DESCRIPTION" && "$PYTHON_PROJECT_DESCRIPTION" != "A brief description of your project" ]]; then
+    description=$(escape_sed_replacement "$PYTHON_PROJECT_DESCRIPTION")
+    sed_expressions+=(-e "s|description = \"A brief description of your project\"|description = \"$description\"|")
   fi
 
   # Update license
-  if [[ -n "$PYTHON_LICENSE" ]]; then
-    sed_inplace "s|license = \"MIT\"|license = \"$PYTHON_LICENSE\"|" "$pyproject_file"
+  if [[ -n "$PYTHON_LICENSE" && "$PYTHON_LICENSE" != "MIT" ]]; then
+    license=$(escape_sed_replacement "$PYTHON_LICENSE")
+    sed_expressions+=(-e "s|license = \"MIT\"|license = \"$license\"|")
   fi
 
   # Update keywords
   if [[ -n "$PYTHON_KEYWORDS" ]]; then
     # Convert comma-separated keywords to proper TOML array format
-    # Remove spaces, split by comma, and format as TOML array
-    local keywords_array
-    keywords_array=$(echo "$PYTHON_KEYWORDS" | sed 's/ //g' | sed 's/,/", "/g' | sed 's/^/["/' | sed 's/$/"]/')
-    sed_inplace "s|keywords = \[\"python\", \"cli\", \"automation\"\]|keywords = $keywords_array|" "$pyproject_file"
+    # Split by comma, trim each keyword, skip empty entries and build the array in one pass
+    local keywords=() keyword keywords_array=""
+    IFS=',' read -r -a keywords <<< "$PYTHON_KEYWORDS"
+    for keyword in "${keywords[@]}"; do
+      keyword="${keyword#"${keyword%%[![:space:]]*}"}"
+      keyword="${keyword%"${keyword##*[![:space:]]}"}"
+      if [[ -n "$keyword" ]]; then
+        keywords_array+="${keywords_array:+, }\"${keyword}\""
+      fi
+    done
+    if [[ -n "$keywords_array" && "$keywords_array" != '"python", "cli", "automation"' ]]; then
+      keywords_array=$(escape_sed_replacement "[${keywords_array}]")
+      sed_expressions+=(-e "s|keywords = \[\"python\", \"cli\", \"automation\"\]|keywords = $keywords_array|")
+    fi
   fi
 
   # Update author information
   if [[ -n "$PYTHON_AUTHOR_NAME" && -n "$PYTHON_AUTHOR_EMAIL" ]]; then
-    sed_inplace "s|{ name = \"Your Name\", email = \"your.email@example.com\" }|{ name = \"$PYTHON_AUTHOR_NAME\", email = \"$PYTHON_AUTHOR_EMAIL\" }|" "$pyproject_file"
+    author_name=$(escape_sed_replacement "$PYTHON_AUTHOR_NAME")
+    author_email=$(escape_sed_replacement "$PYTHON_AUTHOR_EMAIL")
+    sed_expressions+=(-e "s|{ name = \"Your Name\", email = \"your.email@example.com\" }|{ name = \"$author_name\", email = \"$author_email\" }|")
   fi
 
   # Update GitHub URLs
   if [[ -n "$PYTHON_GITHUB_USERNAME" && -n "$PYTHON_GITHUB_PROJECT" ]]; then
-    local base_url="https://github.com/${PYTHON_GITHUB_USERNAME}/${PYTHON_GITHUB_PROJECT}"
-    sed_inplace "s|https://github.com/yourusername/my-awesome-project/blob/main/README.md|${base_url}/blob/main/README.md|" "$pyproject_file"
-    sed_inplace "s|https://github.com/yourusername/my-awesome-project/issues|${base_url}/issues|" "$pyproject_file"
-    sed_inplace "s|https://github.com/yourusername/my-awesome-project|${base_url}|g" "$pyproject_file"
+    # Every project URL (homepage, README, issues, source) starts with the template repository URL,
+    # so one global substitution of that prefix updates them all
+    local base_url
+    base_url=$(escape_sed_replacement "https://github.com/${PYTHON_GITHUB_USERNAME}/${PYTHON_GITHUB_PROJECT}")
+    sed_expressions+=(-e "s|https://github.com/yourusername/my-awesome-project|${base_url}|g")
+  fi
+
+  # Rewrite pyproject.toml once with every collected substitution
+  if [[ ${#sed_expressions[@]} -gt 0 ]]; then
+    sed_inplace "${sed_expressions[@]}" "$pyproject_file"
   fi
 }
 
@@ -1852,207 +1972,88 @@ generate_devcontainer_json() {
   mkdir -p "${project_path}/.devcontainer"
   echo "DEBUG: Directory created successfully" >&2
   
-  # Read the base devcontainer.json up to extensions
-  echo "DEBUG: About to process base devcontainer.json with awk..." >&2
-  # Use sed instead of head -n -1 for macOS compatibility (head -n -1 is GNU-specific)
-  awk '/^      "extensions": \[/,/^      \],$/{if(/^      "extensions": \[/) print; else if(/^      \],$/) exit; else next} !/^      "extensions": \[/' .devcontainer/devcontainer.json | sed '$d' > "$temp_file"
-  local awk_exit=$?
-  echo "DEBUG: Base awk processing completed with exit code: $awk_exit" >&2
+  # Read the template sections once; every extraction below is served from memory
+  load_devcontainer_sections
   
-  if [[ $awk_exit -ne 0 ]]; then
-    echo "DEBUG: ERROR - Initial awk processing failed!" >&2
+  # Write the base devcontainer.json up to extensions from the cached header, updating the name and
+  # runArgs as it is written
+  echo "DEBUG: Writing base devcontainer.json header..." >&2
+  if [[ -z "$DEVCONTAINER_HEADER" ]]; then
+    echo "DEBUG: ERROR - Base devcontainer.json header is empty!" >&2
     return 1
   fi
-  
-  echo "DEBUG: Base file written to temp_file, checking size..." >&2
-  if [[ -f "$temp_file" ]]; then
-    echo "DEBUG: temp_file exists, size: $(wc -l < "$temp_file") lines" >&2
-  else
-    echo "DEBUG: ERROR - temp_file was not created!" >&2
-    return 1
-  fi
-  
-  # Update the name and runArgs in the temp file
-  sed_inplace "s/\"name\": \"[^\"]*\"/\"name\": \"${display_name}\"/" "$temp_file"
-  sed_inplace "s/--name=dynamic-dev-container/--name=${container_name}/g" "$temp_file"
-  sed_inplace "s/dynamic-dev-container-shellhistory/${container_name}-shellhistory/g" "$temp_file"
-  sed_inplace "s/dynamic-dev-container-plugins/${container_name}-plugins/g" "$temp_file"
-  
-  # Start extensions array
-  echo '      "extensions": [' >> "$temp_file"
-  
-  # Always include GitHub extensions
-  echo "DEBUG: About to extract GitHub extensions..." >&2
-  extract_devcontainer_section "// #### Begin Github ####" "// #### End Github ####" | grep -E '^\s*".*",' >> "$temp_file"
-  local github_exit=$?
-  echo "DEBUG: GitHub extensions extraction completed with exit code: $github_exit" >&2
-  
-  if [[ $github_exit -ne 0 ]]; then
-    echo "DEBUG: ERROR - GitHub extensions extraction failed!" >&2
-    return 1
-  fi
-
-  # Include extensions based on selected tools
-  echo "DEBUG: Starting tools loop - TOOL_SELECTED array processing..." >&2
-  if [[ ${#TOOL_SELECTED[@]} -gt 0 ]]; then
-    for tool in "${!TOOL_SELECTED[@]}"; do
-      echo "DEBUG: Processing tool: $tool, selected: ${TOOL_SELECTED[$tool]}" >&2
-      if [[ "${TOOL_SELECTED[$tool]}" == "true" ]]; then
-        echo "DEBUG: Tool $tool is selected, processing case statement..." >&2
-      case "$tool" in
-        "go"|"goreleaser")
-          echo "DEBUG: Extracting Go extensions for tool: $tool" >&2
-          echo "" >> "$temp_file"
-          extract_devcontainer_section "// #### Begin Go ####" "// #### End Go ####" >> "$temp_file"
-          echo "DEBUG: Go extensions extracted successfully for tool: $tool" >&2
-          ;;
-        "dotnet")
-          echo "DEBUG: Extracting .NET extensions for tool: $tool" >&2
-          echo "" >> "$temp_file"
-          extract_devcontainer_section "// #### Begin .NET ####" "// #### End .NET ####" >> "$temp_file"
-          echo "DEBUG: .NET extensions extracted successfully for tool: $tool" >&2
-          ;;
-        "node"|"pnpm"|"yarn"|"deno"|"bun")
-          # JavaScript/Node.js extensions (avoid duplicates)
-          echo "DEBUG: Checking JavaScript/Node.js extensions for tool: $tool" >&2
-          if ! grep -q "// #### Begin JavaScript/Node.js ####" "$temp_file"; then
-            echo "DEBUG: Extracting JavaScript/Node.js extensions for tool: $tool" >&2
-            echo "" >> "$temp_file"
-            extract_devcontainer_section "// #### Begin JavaScript/Node.js ####" "// #### End JavaScript/Node.js ####" >> "$temp_file"
-            echo "DEBUG: JavaScript/Node.js extensions extracted successfully for tool: $tool" >&2
-          else
-            echo "DEBUG: JavaScript/Node.js extensions already present, skipping for tool: $tool" >&2
-          fi
-          ;;
-        "kubectl"|"helm"|"k9s"|"kubectx"|"kubens"|"krew"|"dive"|"kubebench"|"popeye"|"trivy"|"cmctl"|"k3d")
-          # Kubernetes extensions (avoid duplicates)
-          echo "DEBUG: Checking Kubernetes extensions for tool: $tool" >&2
-          if ! grep -q "// #### Begin Kubernetes/Helm ####" "$temp_file"; then
-            echo "DEBUG: Extracting Kubernetes/Helm extensions for tool: $tool" >&2
-            echo "" >> "$temp_file"
-            extract_devcontainer_section "// #### Begin Kubernetes/Helm ####" "// #### End Kubernetes/Helm ####" >> "$temp_file"
-            echo "DEBUG: Kubernetes/Helm extensions extracted successfully for tool: $tool" >&2
-          else
-            echo "DEBUG: Kubernetes/Helm extensions already present, skipping for tool: $tool" >&2
-          fi
-          ;;
-        "opentofu")
-          echo "DEBUG: Extracting Terraform/OpenTofu extensions for tool: $tool" >&2
-          echo "" >> "$temp_file"
-          extract_devcontainer_section "// #### Begin Terraform/OpenTofu ####" "// #### End Terraform/OpenTofu ####" >> "$temp_file"
-          echo "DEBUG: Terraform/OpenTofu extensions extracted successfully for tool: $tool" >&2
-          ;;
-        "packer")
-          echo "DEBUG: Extracting Packer extensions for tool: $tool" >&2
-          echo "" >> "$temp_file"
-          extract_devcontainer_section "// #### Begin Packer ####" "// #### End Packer ####" >> "$temp_file"
-          echo "DEBUG: Packer extensions extracted successfully for tool: $tool" >&2
-          ;;
-        "powershell")
-          echo "DEBUG: Extracting PowerShell extensions for tool: $tool" >&2
-          echo "" >> "$temp_file"
-          extract_devcontainer_section "// #### Begin PowerShell ####" "// #### End PowerShell ####" >> "$temp_file"
-          echo "DEBUG: PowerShell extensions extracted successfully for tool: $tool" >&2
-          ;;
-        "python")
-          # Python extensions (avoid duplicates)
-          echo "DEBUG: Checking Python extensions for tool: $tool" >&2
-          if ! grep -q "// #### Begin Python ####" "$temp_file"; then
-            echo "DEBUG: Extracting Python extensions for tool: $tool" >&2
-            echo "" >> "$temp_file"
-            extract_devcontainer_section "// #### Begin Python ####" "// #### End Python ####" >> "$temp_file"
-            echo "DEBUG: Python extensions extracted successfully for tool: $tool" >&2
-          else
-            echo "DEBUG: Python extensions already present, skipping for tool: $tool" >&2
-          fi
-          ;;
-        *)
-          echo "DEBUG: No specific extension handling for tool: $tool" >&2
-          ;;
-      esac
-    else
-      echo "DEBUG: Tool $tool is not selected" >&2
-    fi
-  done
-  fi
-  echo "DEBUG: Completed tools loop" >&2
-  
-  # Include Python extensions if selected
-  echo "DEBUG: Checking INCLUDE_PYTHON_EXTENSIONS: $INCLUDE_PYTHON_EXTENSIONS" >&2
-  if [[ "$INCLUDE_PYTHON_EXTENSIONS" == "true" ]]; then
-    if ! grep -q "// #### Begin Python ####" "$temp_file"; then
-      echo "DEBUG: Including Python extensions" >&2
-      echo "" >> "$temp_file"
-      extract_devcontainer_section "// #### Begin Python ####" "// #### End Python ####" >> "$temp_file"
-      echo "DEBUG: Python extensions included successfully" >&2
-    else
-      echo "DEBUG: Python extensions already present, skipping INCLUDE_PYTHON_EXTENSIONS" >&2
-    fi
-  fi
-  
-  # Include Markdown extensions if selected
-  echo "DEBUG: Checking INCLUDE_MARKDOWN_EXTENSIONS: $INCLUDE_MARKDOWN_EXTENSIONS" >&2
-  if [[ "$INCLUDE_MARKDOWN_EXTENSIONS" == "true" ]]; then
-    if ! grep -q "// #### Begin Markdown ####" "$temp_file"; then
-      echo "DEBUG: Including Markdown extensions" >&2
-      echo "" >> "$temp_file"
-      extract_devcontainer_section "// #### Begin Markdown ####" "// #### End Markdown ####" >> "$temp_file"
-      echo "DEBUG: Markdown extensions included successfully" >&2
-    else
-      echo "DEBUG: Markdown extensions already present, skipping INCLUDE_MARKDOWN_EXTENSIONS" >&2
-    fi
-  fi
-  
-  # Include Shell/Bash extensions if selected
-  echo "DEBUG: Checking INCLUDE_SHELL_EXTENSIONS: $INCLUDE_SHELL_EXTENSIONS" >&2
-  if [[ "$INCLUDE_SHELL_EXTENSIONS" == "true" ]]; then
-    if ! grep -q "// #### Begin Shell/Bash ####" "$temp_file"; then
-      echo "DEBUG: Including Shell/Bash extensions" >&2
-      echo "" >> "$temp_file"
-      extract_devcontainer_section "// #### Begin Shell/Bash ####" "// #### End Shell/Bash ####" >> "$temp_file"
-      echo "DEBUG: Shell/Bash extensions included successfully" >&2
+  local escaped_display_name escaped_container_name
+  escaped_display_name=$(escape_sed_replacement "$display_name")
+  escaped_container_name=$(escape_sed_replacement "$container_name")
+  printf '%s' "$DEVCONTAINER_HEADER" | \
+    sed -e "s|\"name\": \"[^\"]*\"|\"name\": \"${escaped_display_name}\"|" \
+        -e "s|--name=dynamic-dev-container|--name=${escaped_container_name}|g" \
+        -e "s|dynamic-dev-container-shellhistory|${escaped_container_name}-shellhistory|g" \
+        -e "s|dynamic-dev-container-plugins|${escaped_container_name}-plugins|g" \
+    > "$temp_file"
+  
+  # A failed write has already aborted under set -e, so report the size from the cached header
+  local header_newlines="${DEVCONTAINER_HEADER//[!$'\n']/}"
+  echo "DEBUG: Base file written to temp_file, size: ${#header_newlines} lines" >&2
+  
+  # Start extensions array; everything up to the Core Extensions goes through a single append redirection
+  INCLUDED_EXTENSION_SECTIONS=()
+  collect_active_sections
+  {
+    echo '      "extensions": ['
+  
+    # Always include GitHub extensions
+    echo "DEBUG: About to extract GitHub extensions..." >&2
+    if [[ -n "${DEVCONTAINER_SECTION_BODIES[Github]:-}" ]]; then
+      extract_devcontainer_section_body "Github"
+      echo "DEBUG: GitHub extensions extraction completed" >&2
     else
-      echo "DEBUG: Shell/Bash extensions already present, skipping INCLUDE_SHELL_EXTENSIONS" >&2
+      echo "DEBUG: ERROR - GitHub extensions extraction failed!" >&2
+      return 1
     fi
-  fi
+
+    # Include extensions based on selected tools
+    # Include extensions for the selected tools and optional extension choices
+    echo "DEBUG: Including extension sections: ${ACTIVE_EXTENSION_SECTIONS[*]}" >&2
+    local section
+    for section in "${ACTIVE_EXTENSION_SECTIONS[@]}"; do
+      append_extension_section "$section"
+    done
+    echo "DEBUG: Extension sections included successfully" >&2
   
-  # Include PSI Header extension if selected
-  echo "DEBUG: Checking INSTALL_PSI_HEADER: $INSTALL_PSI_HEADER" >&2
-  if [[ "$INSTALL_PSI_HEADER" == "true" ]]; then
-    if ! grep -q "// #### Begin PSI Header ####" "$temp_file"; then
+    # Include PSI Header extension if selected (append_extension_section skips it if already present)
+    echo "DEBUG: Checking INSTALL_PSI_HEADER: $INSTALL_PSI_HEADER" >&2
+    if [[ "$INSTALL_PSI_HEADER" == "true" ]]; then
       echo "DEBUG: Including PSI Header extensions" >&2
-      echo "" >> "$temp_file"
-      extract_devcontainer_section "// #### Begin PSI Header ####" "// #### End PSI Header ####" >> "$temp_file"
-      echo "DEBUG: PSI Header extensions included successfully" >&2
-    else
-      echo "DEBUG: PSI Header extensions already present, skipping INSTALL_PSI_HEADER" >&2
+      append_extension_section "PSI Header"
     fi
-  fi
   
-  # Include JavaScript/TypeScript extensions if Node.js was installed
-  echo "DEBUG: Checking TOOL_SELECTED[node]: ${TOOL_SELECTED[node]:-false}" >&2
-  if [[ "${TOOL_SELECTED[node]:-false}" == "true" ]]; then
-    if ! grep -q "// #### Begin JavaScript/TypeScript ####" "$temp_file"; then
+    # Include JavaScript/TypeScript extensions if Node.js was installed (append_extension_section skips
+    # them if already present)
+    echo "DEBUG: Checking TOOL_SELECTED[node]: ${TOOL_SELECTED[node]:-false}" >&2
+    if [[ "${TOOL_SELECTED[node]:-false}" == "true" ]]; then
       echo "DEBUG: Including JavaScript/TypeScript extensions" >&2
       INCLUDE_JS_EXTENSIONS=true
-      echo "" >> "$temp_file"
-      extract_devcontainer_section "// #### Begin JavaScript/TypeScript ####" "// #### End JavaScript/TypeScript ####" >> "$temp_file"
-      echo "DEBUG: JavaScript/TypeScript extensions included successfully" >&2
-    else
-      echo "DEBUG: JavaScript/TypeScript extensions already present, skipping Node.js check" >&2
+      append_extension_section "JavaScript/TypeScript"
     fi
-  fi
   
-  # Always include Core Extensions
-  echo "DEBUG: Including Core extensions" >&2
-  # shellcheck disable=SC2129
-  echo "" >> "$temp_file"
-  extract_devcontainer_section "// #### Begin Core Extensions ####" "// #### End Core Extensions ####" >> "$temp_file"
-  echo "DEBUG: Core extensions included successfully" >&2
+    # Always include Core Extensions
+    echo "DEBUG: Including Core extensions" >&2
+    append_extension_section "Core Extensions"
+    echo "DEBUG: Core extensions included successfully" >&2
+  } >> "$temp_file"
 
-  # Remove trailing comma from the last extension entry
+  # Remove trailing comma from the last extension entry. The array always ends with the Core Extensions
+  # section, so check its cached last line first and only rescan and rewrite the file when it needs the fix.
   echo "DEBUG: Removing trailing comma from last extension entry" >&2
-  last_ext_line=$(grep -n '^\s*".*",' "$temp_file" | tail -n 1 | cut -d: -f1)
+  local core_extensions="${DEVCONTAINER_SECTION_BODIES[Core Extensions]:-}"
+  local last_core_extension="${core_extensions%$'\n'}"
+  last_core_extension="${last_core_extension##*$'\n'}"
+  local last_ext_line=""
+  if [[ -z "$last_core_extension" || "$last_core_extension" == *'",' ]]; then
+    # Line number of the last quoted entry that ends in a comma
+    last_ext_line=$(awk '/^[[:space:]]*".*",/ { last = NR } END { if (last) print last }' "$temp_file")
+  fi
   if [[ -n "$last_ext_line" ]]; then
     echo "DEBUG: Found trailing comma at line $last_ext_line, removing it" >&2
     sed_inplace "${last_ext_line}s/,$//" "$temp_file"
@@ -2061,151 +2062,64 @@ generate_devcontainer_json() {
     echo "DEBUG: No trailing comma found" >&2
   fi
 
-  # Close extensions array and add settings
-  echo "DEBUG: Closing extensions array and adding settings" >&2
-  echo "      ]," >> "$temp_file"
-  echo "DEBUG: Extensions array closed successfully" >&2
+  # Close extensions array and add settings, again through a single append redirection
+  {
+    echo "DEBUG: Closing extensions array and adding settings" >&2
+    echo "      ],"
+    echo "DEBUG: Extensions array closed successfully" >&2
 
-  # Add settings section
-  echo "DEBUG: Adding settings section" >&2
-  echo '      "settings": {' >> "$temp_file"
-  echo "DEBUG: Settings section opened" >&2
+    # Add settings section
+    echo "DEBUG: Adding settings section" >&2
+    echo '      "settings": {'
+    echo "DEBUG: Settings section opened" >&2
 
-  # Always include Core VS Code Settings
-  echo "DEBUG: Including Core VS Code Settings" >&2
-  extract_devcontainer_section "// #### Begin Core VS Code Settings ####" "// #### End Core VS Code Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-  echo "DEBUG: Core VS Code Settings included successfully" >&2
-  
-  # Include settings based on selected tools
-  echo "DEBUG: Starting settings processing loop" >&2
-  for tool in "${!TOOL_SELECTED[@]}"; do
-    if [[ "${TOOL_SELECTED[$tool]}" == "true" ]]; then
-      echo "DEBUG: Processing settings for tool: $tool" >&2
-      case "$tool" in
-        "go"|"goreleaser")
-          # Go settings (avoid duplicates)
-          echo "DEBUG: Checking Go settings for tool: $tool" >&2
-          if ! grep -q "go.toolsManagement.autoUpdate" "$temp_file"; then
-            echo "DEBUG: Adding Go settings for tool: $tool" >&2
-            # shellcheck disable=SC2129
-            extract_devcontainer_section "// #### Begin Go Settings ####" "// #### End Go Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-            echo "DEBUG: Go settings added successfully for tool: $tool" >&2
-          else
-            echo "DEBUG: Go settings already present, skipping for tool: $tool" >&2
-          fi
-          ;;
-        "dotnet")
-          echo "DEBUG: Adding .NET settings for tool: $tool" >&2
-          # shellcheck disable=SC2129
-          extract_devcontainer_section "// #### Begin .NET Settings ####" "// #### End .NET Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-          echo "DEBUG: .NET settings added successfully for tool: $tool" >&2
-          ;;
-        "node"|"pnpm"|"yarn"|"deno"|"bun")
-          # JavaScript/Node.js settings (avoid duplicates)
-          echo "DEBUG: Checking JavaScript/Node.js settings for tool: $tool" >&2
-          if ! grep -q "typescript.preferences.includePackageJsonAutoImports" "$temp_file"; then
-            echo "DEBUG: Adding JavaScript/Node.js settings for tool: $tool" >&2
-            # shellcheck disable=SC2129
-            extract_devcontainer_section "// #### Begin JavaScript/Node.js Settings ####" "// #### End JavaScript/Node.js Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-            echo "DEBUG: JavaScript/Node.js settings added successfully for tool: $tool" >&2
-          else
-            echo "DEBUG: JavaScript/Node.js settings already present, skipping for tool: $tool" >&2
-          fi
-          ;;
-        "kubectl"|"helm"|"k9s"|"kubectx"|"kubens"|"krew"|"dive"|"kubebench"|"popeye"|"trivy"|"cmctl"|"k3d")
-          echo "DEBUG: Checking Kubernetes settings for tool: $tool" >&2
-          # Kubernetes settings (avoid duplicates)
-          if ! grep -q "helm-intellisense.lintFileOnSave" "$temp_file"; then
-            echo "DEBUG: Adding Kubernetes/Helm settings for tool: $tool" >&2
-            # shellcheck disable=SC2129
-            extract_devcontainer_section "// #### Begin Kubernetes/Helm Settings ####" "// #### End Kubernetes/Helm Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-            echo "DEBUG: Kubernetes/Helm settings added successfully for tool: $tool" >&2
-          else
-            echo "DEBUG: Kubernetes/Helm settings already present, skipping for tool: $tool" >&2
-          fi
-          ;;
-        "powershell")
-          echo "DEBUG: Adding PowerShell settings for tool: $tool" >&2
-          # shellcheck disable=SC2129
-          extract_devcontainer_section "// #### Begin PowerShell Settings ####" "// #### End PowerShell Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-          echo "DEBUG: PowerShell settings added successfully for tool: $tool" >&2
-          ;;
-        *)
-          echo "DEBUG: No specific settings handling for tool: $tool" >&2
-          ;;
-      esac
-    else
-      echo "DEBUG: Tool $tool is not selected for settings" >&2
-    fi
-  done
-  echo "DEBUG: Completed settings processing loop" >&2
-  
-  # Include Python settings if Python extensions were selected
-  echo "DEBUG: Checking INCLUDE_PYTHON_EXTENSIONS for settings: $INCLUDE_PYTHON_EXTENSIONS" >&2
-  if [[ "$INCLUDE_PYTHON_EXTENSIONS" == "true" ]]; then
-    if ! grep -q "python.defaultInterpreterPath" "$temp_file"; then
-      echo "DEBUG: Including Python settings" >&2
-      # shellcheck disable=SC2129
-      extract_devcontainer_section "// #### Begin Python Settings ####" "// #### End Python Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-      echo "DEBUG: Python settings included successfully" >&2
-    else
-      echo "DEBUG: Python settings already present, skipping INCLUDE_PYTHON_EXTENSIONS" >&2
-    fi
-  fi
+    # Always include Core VS Code Settings
+    echo "DEBUG: Including Core VS Code Settings" >&2
+    append_settings_section "Core VS Code"
+    echo "DEBUG: Core VS Code Settings included successfully" >&2
   
-  # Include Markdown settings if Markdown extensions were selected
-  echo "DEBUG: Checking INCLUDE_MARKDOWN_EXTENSIONS for settings: $INCLUDE_MARKDOWN_EXTENSIONS" >&2
-  if [[ "$INCLUDE_MARKDOWN_EXTENSIONS" == "true" ]]; then
-    if ! grep -q "markdown.extension.orderedList.autoRenumber" "$temp_file"; then
-      echo "DEBUG: Including Markdown settings" >&2
-      # shellcheck disable=SC2129
-      extract_devcontainer_section "// #### Begin Markdown Settings ####" "// #### End Markdown Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-      echo "DEBUG: Markdown settings included successfully" >&2
-    else
-      echo "DEBUG: Markdown settings already present, skipping INCLUDE_MARKDOWN_EXTENSIONS" >&2
-    fi
-  fi
-  
-  # Include Shell/Bash settings if Shell extensions were selected
-  echo "DEBUG: Checking INCLUDE_SHELL_EXTENSIONS for settings: $INCLUDE_SHELL_EXTENSIONS" >&2
-  if [[ "$INCLUDE_SHELL_EXTENSIONS" == "true" ]]; then
-    if ! grep -q "shellcheck.customArgs" "$temp_file"; then
-      echo "DEBUG: Including Shell/Bash settings" >&2
-      # shellcheck disable=SC2129
-      extract_devcontainer_section "// #### Begin Shell/Bash Settings ####" "// #### End Shell/Bash Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-      echo "DEBUG: Shell/Bash settings included successfully" >&2
-    else
-      echo "DEBUG: Shell/Bash settings already present, skipping INCLUDE_SHELL_EXTENSIONS" >&2
-    fi
-  fi
-  
-  # Include JavaScript/TypeScript settings if JS extensions were selected
-  echo "DEBUG: Checking INCLUDE_JS_EXTENSIONS for settings: $INCLUDE_JS_EXTENSIONS" >&2
-  if [[ "$INCLUDE_JS_EXTENSIONS" == "true" ]]; then
-    if ! grep -q "typescript.preferences.includePackageJsonAutoImports" "$temp_file"; then
-      echo "DEBUG: Including JavaScript/TypeScript settings" >&2
-      # shellcheck disable=SC2129
-      extract_devcontainer_section "// #### Begin JavaScript/TypeScript Settings ####" "// #### End JavaScript/TypeScript Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-      echo "DEBUG: JavaScript/TypeScript settings included successfully" >&2
-    else
-      echo "DEBUG: JavaScript/TypeScript settings already present, skipping INCLUDE_JS_EXTENSIONS" >&2
+    # Include settings for the selected tools and optional extension choices
+    echo "DEBUG: Including settings sections: ${ACTIVE_SETTINGS_SECTIONS[*]}" >&2
+    for section in "${ACTIVE_SETTINGS_SECTIONS[@]}"; do
+      append_settings_section "$section"
+    done
+    echo "DEBUG: Settings sections included successfully" >&2
+  
+    # Include JavaScript/TypeScript settings if JS extensions were selected
+    echo "DEBUG: Checking INCLUDE_JS_EXTENSIONS for settings: $INCLUDE_JS_EXTENSIONS" >&2
+    if [[ "$INCLUDE_JS_EXTENSIONS" == "true" ]]; then
+      # Look for the JS settings in the cached bodies of the settings sections written so far
+      local js_settings_present=false
+      for section in "Core VS Code" "${ACTIVE_SETTINGS_SECTIONS[@]}"; do
+        if [[ "${DEVCONTAINER_SECTION_BODIES["$section Settings"]:-}" == *"typescript.preferences.includePackageJsonAutoImports"* ]]; then
+          js_settings_present=true
+          break
+        fi
+      done
+      if [[ "$js_settings_present" == false ]]; then
+        echo "DEBUG: Including JavaScript/TypeScript settings" >&2
+        append_settings_section "JavaScript/TypeScript"
+        echo "DEBUG: JavaScript/TypeScript settings included successfully" >&2
+      else
+        echo "DEBUG: JavaScript/TypeScript settings already present, skipping INCLUDE_JS_EXTENSIONS" >&2
+      fi
     fi
-  fi
   
-  # Always include spell checker settings
-  echo "DEBUG: Including Spell Checker settings" >&2
-  extract_devcontainer_section "// #### Begin Spell Checker Settings ####" "// #### End Spell Checker Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-  echo "DEBUG: Spell Checker settings included successfully" >&2
+    # Always include spell checker settings
+    echo "DEBUG: Including Spell Checker settings" >&2
+    append_settings_section "Spell Checker"
+    echo "DEBUG: Spell Checker settings included successfully" >&2
   
-  # Always include Mise settings (since Mise extension is in Core Extensions)
-  echo "DEBUG: Including Mise settings" >&2
-  extract_devcontainer_section "// #### Begin Mise Settings ####" "// #### End Mise Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-  echo "DEBUG: Mise settings included successfully" >&2
+    # Always include Mise settings (since Mise extension is in Core Extensions)
+    echo "DEBUG: Including Mise settings" >&2
+    append_settings_section "Mise"
+    echo "DEBUG: Mise settings included successfully" >&2
   
-  # Include TODO Tree settings
-  echo "DEBUG: Including TODO Tree settings" >&2
-  extract_devcontainer_section "// #### Begin TODO Tree Settings ####" "// #### End TODO Tree Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
-  echo "DEBUG: TODO Tree settings included successfully" >&2
+    # Include TODO Tree settings
+    echo "DEBUG: Including TODO Tree settings" >&2
+    append_settings_section "TODO Tree"
+    echo "DEBUG: TODO Tree settings included successfully" >&2
+  } >> "$temp_file"
   
   # Include PSI Header settings if configured, otherwise include default ones
   echo "DEBUG: Checking INSTALL_PSI_HEADER for settings: $INSTALL_PSI_HEADER" >&2
@@ -2215,64 +2129,32 @@ generate_devcontainer_json() {
     echo "DEBUG: PSI Header settings generated successfully" >&2
   else
     echo "DEBUG: Including default PSI Header settings" >&2
-    extract_devcontainer_section "// #### Begin PSI Header Settings ####" "// #### End PSI Header Settings ####" | grep -v "^\s*//.*Begin\|^\s*//.*End" >> "$temp_file"
+    append_settings_section "PSI Header" >> "$temp_file"
     echo "DEBUG: Default PSI Header settings included successfully" >&2
   fi
   
   # Fix settings entries to ensure proper JSON formatting
   echo "DEBUG: Starting JSON formatting fixes..." >&2
   
-  # Simple approach: just ensure all setting lines have commas except the very last one
-  # Get all setting property lines (8 spaces + quoted property)
-  setting_line_numbers=$(grep -n '^        "[^"]*":' "$temp_file" | grep -v '[\{\[][\s]*$' | cut -d: -f1)
-  
-  if [[ -n "$setting_line_numbers" ]]; then
-    echo "DEBUG: Found setting lines to process" >&2
-    
-    # Add commas to all setting lines first
-    while read -r line_num; do
-      [[ -n "$line_num" ]] || continue
-      # Only add comma if line doesn't already have one
-      if ! sed -n "${line_num}p" "$temp_file" | grep -q ',$'; then
-        sed_inplace "${line_num}s/$/,/" "$temp_file"
-      fi
-    done <<< "$setting_line_numbers"
-    
-    # Find the very last setting line and remove its comma
-    last_setting_line=$(grep -n '^        "[^"]*":' "$temp_file" | tail -n 1 | cut -d: -f1)
-    if [[ -n "$last_setting_line" ]]; then
-      echo "DEBUG: Removing comma from last setting line: $last_setting_line" >&2
-      sed_inplace "${last_setting_line}s/,$//" "$temp_file"
-    fi
-  fi
+  # Ensure all setting lines (8 spaces + quoted property) have commas except the very last one.
+  # A single awk run does this in two passes over the file: the first finds the last setting
+  # line, the second adds missing commas (skipping lines that open an object or array) and
+  # strips the comma from that last line. It also closes the settings, customizations and root
+  # objects, so the formatted file is moved straight into place with no separate append step.
+  echo "DEBUG: Closing JSON structure and moving it to ${project_path}/.devcontainer/devcontainer.json" >&2
+  awk '
+    NR == FNR { if (/^        "[^"]*":/) last = FNR; next }
+    /^        "[^"]*":/ {
+      if ($0 !~ /[{[]$/ && $0 !~ /,$/) $0 = $0 ","
+      if (FNR == last) sub(/,$/, "")
+    }
+    { print }
+    END { print "      }"; print "    }"; print "  }"; print "}" }
+  ' "$temp_file" "$temp_file" > "${temp_file}.fmt"
+  move_if_changed "${temp_file}.fmt" "${project_path}/.devcontainer/devcontainer.json"
+  rm -f "$temp_file"
   
   echo "DEBUG: JSON formatting completed" >&2
-
-  # Close settings and customizations
-  echo "DEBUG: Closing JSON structure..." >&2
-  echo '      }' >> "$temp_file"
-  echo '    }' >> "$temp_file"
-  echo '  }' >> "$temp_file"
-  echo '}' >> "$temp_file"
-  echo "DEBUG: JSON structure closed" >&2
-  
-  echo "DEBUG: Moving temp file to final location..." >&2
-  echo "DEBUG: Source: $temp_file" >&2
-  echo "DEBUG: Destination: ${project_path}/.devcontainer/devcontainer.json" >&2
-  
-  if [[ -f "$temp_file" ]]; then
-    echo "DEBUG: temp_file exists, moving..." >&2
-    mv "$temp_file" "${project_path}/.devcontainer/devcontainer.json"
-    local mv_exit=$?
-    echo "DEBUG: mv exit code: $mv_exit" >&2
-    if [[ $mv_exit -ne 0 ]]; then
-      echo "DEBUG: ERROR - mv command failed!" >&2
-      return 1
-    fi
-  else
-    echo "DEBUG: ERROR - temp_file does not exist!" >&2
-    return 1
-  fi
   
   echo "DEBUG: generate_devcontainer_json function completed successfully" >&2
 }
@@ -2281,27 +2163,29 @@ generate_devcontainer_json() {
 main() {
   # Handle help argument
   if [[ "${1:-}" == "--help" || "${1:-}" == "-h" ]]; then
-    echo "Dynamic Dev Container TUI Setup"
-    echo ""
-    echo "Usage: $0 <path-to-your-project>"
-    echo ""
-    echo "This script creates a development container configuration with a Terminal User Interface."
-    echo "It will guide you through selecting development tools and configuring your project."
-    echo ""
-    echo "Arguments:"
-    echo "  path-to-your-project    Path where the dev container will be created"
-    echo ""
-    echo "Options:"
-    echo "  -h, --help             Show this help message"
-    echo ""
-    echo "Examples:"
-    echo "  $0 ~/my-project"
-    echo "  $0 /workspace/new-project"
+    printf '%s\n' \
+      "Dynamic Dev Container TUI Setup" \
+      "" \
+      "Usage: $0 <path-to-your-project>" \
+      "" \
+      "This script creates a development container configuration with a Terminal User Interface." \
+      "It will guide you through selecting development tools and configuring your project." \
+      "" \
+      "Arguments:" \
+      "  path-to-your-project    Path where the dev container will be created" \
+      "" \
+      "Options:" \
+      "  -h, --help             Show this help message" \
+      "" \
+      "Examples:" \
+      "  $0 ~/my-project" \
+      "  $0 /workspace/new-project"
     exit 0
   fi
   
   check_dependencies
   source_colors
+  write_dialog_config
   
   # Verify we're in the correct directory by checking for required files
   if [[ ! -f ".devcontainer/devcontainer.json" ]] || [[ ! -f ".mise.toml" ]]; then
@@ -2359,7 +2243,6 @@ main() {
 
   # Show configuration summary and confirm
   if ! show_summary; then
-    clear
     dialog --title "Cancelled" --msgbox "Installation cancelled by user." 8 40
     exit 0
   fi
@@ -2469,39 +2352,54 @@ main() {
   echo "DEBUG: === Configuration generation phase completed successfully ==="
   # Show completion message
   clear
-  echo -e "${GREEN}Installation completed successfully!${NC}"
-  echo ""
-  echo -e "${CYAN}Project Settings Applied:${NC}"
-  echo -e "  Project Name: ${PROJECT_NAME}"
-  echo -e "  Container Name: ${CONTAINER_NAME}"
-  echo -e "  Display Name: ${DISPLAY_NAME}"
-  [[ -n "$DOCKER_EXEC_COMMAND" ]] && echo -e "  Docker Exec Command: ${DOCKER_EXEC_COMMAND}"
-  echo ""
-  echo -e "${CYAN}Next steps:${NC}"
-  echo -e "1. ${YELLOW}Recommended:${NC} Set GITHUB_TOKEN environment variable to avoid API rate limits"
-  echo -e "   export GITHUB_TOKEN=\"your_github_token_here\""
-  echo -e "2. Review and adjust settings in ${project_path}/.devcontainer/devcontainer.json if needed"
-  echo -e "3. Review and adjust tool versions in ${project_path}/.mise.toml if needed"
+  # Collect the completion message and print it in one go
+  local summary_lines=(
+    "${GREEN}Installation completed successfully!${NC}"
+    ""
+    "${CYAN}Project Settings Applied:${NC}"
+    "  Project Name: ${PROJECT_NAME}"
+    "  Container Name: ${CONTAINER_NAME}"
+    "  Display Name: ${DISPLAY_NAME}"
+  )
+  [[ -n "$DOCKER_EXEC_COMMAND" ]] && summary_lines+=("  Docker Exec Command: ${DOCKER_EXEC_COMMAND}")
+  summary_lines+=(
+    ""
+    "${CYAN}Next steps:${NC}"
+    "1. ${YELLOW}Recommended:${NC} Set GITHUB_TOKEN environment variable to avoid API rate limits"
+    "   export GITHUB_TOKEN=\"your_github_token_here\""
+    "2. Review and adjust settings in ${project_path}/.devcontainer/devcontainer.json if needed"
+    "3. Review and adjust tool versions in ${project_path}/.mise.toml if needed"
+  )
   if [[ "$INSTALL_PYTHON_TOOLS" == "true" ]]; then
-    echo -e "4. ${YELLOW}Python Development:${NC} Your Python project has been automatically configured!"
+    summary_lines+=("4. ${YELLOW}Python Development:${NC} Your Python project has been automatically configured!")
     if [[ -n "$PYTHON_PROJECT_NAME" ]]; then
-      echo -e "   - Project structure created in src/$(echo "$PYTHON_PROJECT_NAME" | tr '[:upper:]' '[:lower:]' | tr '-' '_' | tr ' ' '_')/"
-      echo -e "   - Project metadata configured with your provided information"
+      python_package_name "$PYTHON_PROJECT_NAME"
+      summary_lines+=(
+        "   - Project structure created in src/${PYTHON_PACKAGE_NAME}/"
+        "   - Project metadata configured with your provided information"
+      )
     fi
     if [[ -n "$PYTHON_PUBLISH_URL" ]]; then
-      echo -e "   - Repository URLs configured for your package storage"
-      echo -e "   - Set authentication: export HATCH_INDEX_USER=username HATCH_INDEX_AUTH=token"
-      echo -e "   - Use: hatch publish -r repo-name (e.g., hatch publish -r test)"
+      summary_lines+=(
+        "   - Repository URLs configured for your package storage"
+        "   - Set authentication: export HATCH_INDEX_USER=username HATCH_INDEX_AUTH=token"
+        "   - Use: hatch publish -r repo-name (e.g., hatch publish -r test)"
+      )
     else
-      echo -e "   - Review Hatch publish settings if you plan to publish packages"
+      summary_lines+=("   - Review Hatch publish settings if you plan to publish packages")
     fi
-    echo -e "   - Build with: hatch build"
-    echo -e "5. See README.md for additional configuration"
+    summary_lines+=(
+      "   - Build with: hatch build"
+      "5. See README.md for additional configuration"
+    )
   else
-    echo -e "4. See README.md for detailed configuration instructions"
+    summary_lines+=("4. See README.md for detailed configuration instructions")
   fi
-  echo ""
-  echo -e "${BLUE}You can now run:${NC} cd ${project_path} && ./dev.sh"
+  summary_lines+=(
+    ""
+    "${BLUE}You can now run:${NC} cd ${project_path} && ./dev.sh"
+  )
+  printf '%b\n' "${summary_lines[@]}"
 }
 
 
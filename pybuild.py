@@ -11,17 +11,21 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
 import time
 import tomllib
 from pathlib import Path
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 
 from loguru import logger
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
-from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+if TYPE_CHECKING:
+    from watchdog.events import FileSystemEvent
 
 # Define constants
 FILE_CHANGE_DEBOUNCE_SECONDS = 3
+SPINNER_INTERVAL_SECONDS = 0.1
 SPINNER_STATES = ["|", "/", "-", "\\"]
 PYTHON_FILE_EXTENSION = ".py"
 DIST_DIR_NAME = "dist"
@@ -64,13 +68,12 @@ def load_config() -> PyBuildConfig:
 
     """
     pyproject_path = Path("pyproject.toml")
-    if not pyproject_path.exists():
-        msg = "pyproject.toml file not found. This file is required for configuration."
-        raise ConfigurationError(msg)
-
     try:
         with pyproject_path.open("rb") as f:
             pyproject_data = tomllib.load(f)
+    except FileNotFoundError as e:
+        msg = "pyproject.toml file not found. This file is required for configuration."
+        raise ConfigurationError(msg) from e
     except Exception as e:
         msg = f"Could not parse pyproject.toml file: {e}"
         raise ConfigurationError(msg) from e
@@ -198,6 +201,9 @@ def dev(continuously: bool = False) -> None:
 
     logger.info("Running in continuous mode. Monitoring for file changes in 'src'.")
 
+    # Deferred so one-shot commands skip loading watchdog's platform observer backends
+    from watchdog.observers import Observer  # noqa: PLC0415
+
     event_handler = ChangeHandler()
     observer = Observer()
     observer.schedule(event_handler, path="src", recursive=True)
@@ -222,29 +228,23 @@ def _continuous_build_loop(event_handler: ChangeHandler) -> None:
 
     try:
         while True:
-            if event_handler.modified:
-                last_modified_time = time.time()
-                event_handler.modified = False
+            # Block until a file changes or the spinner interval elapses
+            if event_handler.modified.wait(SPINNER_INTERVAL_SECONDS):
+                last_modified_time = time.monotonic()
+                event_handler.modified.clear()
                 print(
                     "  \033[94m\033[0m  ",
                     end="",
                     flush=True,
                 )  # Blue save icon for file change
 
-            current_time = time.time()
-            if last_modified_time and current_time - last_modified_time >= FILE_CHANGE_DEBOUNCE_SECONDS:
+            if last_modified_time is not None and time.monotonic() - last_modified_time >= FILE_CHANGE_DEBOUNCE_SECONDS:
                 _execute_build_cycle()
                 last_modified_time = None
 
-            elif last_modified_time and current_time - last_modified_time < FILE_CHANGE_DEBOUNCE_SECONDS:
-                _show_spinner(spinner_index)
-                spinner_index = (spinner_index + 1) % len(SPINNER_STATES)
-
-            if not last_modified_time:
-                _show_spinner(spinner_index)
-                spinner_index = (spinner_index + 1) % len(SPINNER_STATES)
-
-            time.sleep(0.1)
+            # The spinner advances on every tick, whether a change is pending or not
+            _show_spinner(spinner_index)
+            spinner_index = (spinner_index + 1) % len(SPINNER_STATES)
     finally:
         # Show cursor again when exiting
         print("\033[?25h", end="", flush=True)
@@ -470,15 +470,13 @@ def is_package_installed(package_name: str) -> bool:
 
     """
 
-    try:
-        subprocess.run(
-            [sys.executable, "-m", "pip", "show", package_name],
-            check=True,
-            stdout=subprocess.DEVNULL,
-        )
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    # pip show exits non-zero when the package is not installed
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "show", package_name],
+        check=False,
+        stdout=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
 
 
 def check_requirements(task: str) -> None:
@@ -534,7 +532,8 @@ def run_command(
         If the command fails.
 
     """
-    logger.debug(f"Running command: {' '.join(command)}")
+    # Lazy so the command line is only joined when DEBUG output is enabled
+    logger.opt(lazy=True).debug("Running command: {}", lambda: " ".join(command))
 
     # Filter out empty strings from command
     command = [arg for arg in command if arg]
@@ -563,9 +562,9 @@ class ChangeHandler(FileSystemEventHandler):
     """Handler to track file changes in the src directory."""
 
     def __init__(self) -> None:
-        """Initialize the ChangeHandler and set the modified flag to False."""
+        """Initialize the ChangeHandler with the modified event cleared."""
         super().__init__()
-        self.modified = False
+        self.modified = threading.Event()
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle the event when a file is modified.
@@ -581,7 +580,7 @@ class ChangeHandler(FileSystemEventHandler):
 
         src_path = str(event.src_path)
         if src_path.endswith(PYTHON_FILE_EXTENSION):  # Monitor only Python files
-            self.modified = True
+            self.modified.set()
 
 
 def parse_arguments() -> argparse.ArgumentParser:
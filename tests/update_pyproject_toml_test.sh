@@ -0,0 +1,47 @@
+#!/usr/bin/env bash
+# Regression test for update_pyproject_toml in install.sh: user-entered values containing sed
+# metacharacters ('&' and '|') must end up in pyproject.toml verbatim.
+#
+# Usage: tests/update_pyproject_toml_test.sh
+
+set -euo pipefail
+
+REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+cd "$REPO_ROOT"
+
+# shellcheck source=../install.sh
+source ./install.sh
+
+work_dir="$(mktemp -d)"
+trap 'rm -rf "$work_dir"' EXIT
+cp pyproject.toml "$work_dir/"
+
+INCLUDE_PYTHON_EXTENSIONS=true
+PYTHON_PROJECT_NAME="a&b|c"
+PYTHON_PROJECT_DESCRIPTION="Fast & small | simple"
+PYTHON_KEYWORDS="x&y,z|w"
+PYTHON_GITHUB_USERNAME="jo"
+PYTHON_GITHUB_PROJECT="a&b|c"
+
+update_pyproject_toml "$work_dir"
+
+failures=0
+expect_line() {
+  if ! grep -qF -- "$1" "$work_dir/pyproject.toml"; then
+    echo "FAIL: pyproject.toml has no line containing: $1"
+    failures=$((failures + 1))
+  fi
+}
+
+expect_line 'name = "a&b|c"'
+expect_line 'description = "Fast & small | simple"'
+expect_line 'keywords = ["x&y", "z|w"]'
+expect_line 'Homepage = "https://github.com/jo/a&b|c"'
+expect_line 'Source = "https://github.com/jo/a&b|c"'
+expect_line 'Documentation = "https://github.com/jo/a&b|c/blob/main/README.md"'
+expect_line '"Bug Tracker" = "https://github.com/jo/a&b|c/issues"'
+
+if ((failures > 0)); then
+  exit 1
+fi
+echo "PASS: update_pyproject_toml"